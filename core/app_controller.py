@@ -2,15 +2,55 @@
 
 from __future__ import annotations
 
+import heapq
 import time
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import List, Tuple
+from typing import Callable, Dict, Iterable, List, Tuple
 
 from core.i18n import I18N
 from core.input_events import EventType, InputEvent
 
-FILTERS = ["none", "vintage", "bw", "vivid", "portrait"]
+FILTERS = ("none", "vintage", "bw", "vivid", "portrait")
+_N_FILTERS = len(FILTERS)  # FILTERS is a fixed tuple, so the cycle length is a constant
+
+# more queued rects than this are collapsed into one full-screen update
+_MAX_DIRTY_RECTS = 32
+
+# UI_MOTION: HOW TO CHANGE -> toast lifetime; expiry is scheduled by the controller, not polled.
+TOAST_SEC = 0.6
+
+
+def _merge_rects(rects: List[Tuple[int, int, int, int]]):
+    """Replace overlapping (x, y, w, h) rects by their bounding box, in place, until none overlap.
+
+    Duplicates and contained rects fall out as a special case. Quadratic, but the list is
+    capped at _MAX_DIRTY_RECTS and usually holds one or two entries.
+    """
+    i = 0
+    while i < len(rects):
+        ax, ay, aw, ah = rects[i]
+        grown = False
+        j = i + 1
+        while j < len(rects):
+            bx, by, bw, bh = rects[j]
+            if ax < bx + bw and bx < ax + aw and ay < by + bh and by < ay + ah:
+                x0 = ax if ax < bx else bx
+                y0 = ay if ay < by else by
+                x1 = ax + aw if ax + aw > bx + bw else bx + bw
+                y1 = ay + ah if ay + ah > by + bh else by + bh
+                ax, ay, aw, ah = x0, y0, x1 - x0, y1 - y0
+                # order is irrelevant to display.update(): swap-remove
+                rects[j] = rects[-1]
+                rects.pop()
+                grown = True
+            else:
+                j += 1
+        if grown:
+            rects[i] = (ax, ay, aw, ah)
+            i = 0  # the bigger box may now reach rects already checked
+        else:
+            i += 1
 
 
 class Scene(Enum):
@@ -18,7 +58,7 @@ class Scene(Enum):
     GALLERY = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class AppState:
     lang: str = "en"
     scene: Scene = Scene.CAMERA
@@ -32,9 +72,19 @@ class AppState:
     last_input_latency_ms: float = 0.0
     dirty_rects: List[Tuple[int, int, int, int]] = field(default_factory=list)
     toast: str = ""
+    # string table for `lang`, resolved once per language switch instead of on every t() call
+    _strings: dict = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._strings = I18N[self.lang]
+
+    def set_lang(self, lang: str):
+        """Switch language; use this rather than assigning `lang` so t() stays in sync."""
+        self.lang = lang
+        self._strings = I18N[lang]
 
     def t(self, key: str) -> str:
-        return I18N[self.lang].get(key, key)
+        return self._strings.get(key, key)
 
     @property
     def filter_name(self) -> str:
@@ -46,48 +96,185 @@ class AppController:
         self.width = width
         self.height = height
         self.state = AppState()
+        self.toast_sec = TOAST_SEC
+        # shutter toast text for the current language; refreshed by _on_toggle_lang()
+        self._toast_capture = self.state.t("capture")
+        # last_input_latency_ms is a debug-overlay metric; only pay for the clock reads while shown
+        self.measure_latency = False
+        # dirty tracking: one full-screen rect replaces everything once set
+        self._full_dirty = False
+        self._dirty_area = 0
+        self._spare_rects: List[Tuple[int, int, int, int]] = []
+        # drain() output, recycled per batch
+        self._batch: List[InputEvent] = []
+        # min-heap of (deadline, name); tick() reads the clock only while something is pending
+        self._timers: List[Tuple[float, str]] = []
+        self._deadlines: Dict[str, float] = {}
+        # partial-redraw regions, built once instead of per event
+        self._rect_full = (0, 0, width, height)
+        self._rect_top = (0, 0, width, 90)
+        self._rect_flash = (width - 180, 0, 180, 90)
+        self._rect_bottom = (0, height - 70, width, 70)
+        # EventType -> bound handler; one dict lookup per event instead of an elif chain
+        self._dispatch: Dict[EventType, Callable[[InputEvent], None]] = {
+            EventType.TOUCH_DOWN: self._on_touch_down,
+            EventType.TOUCH_UP: self._on_touch_up,
+            EventType.ENCODER_DETENT: self._on_encoder_detent,
+            EventType.ENCODER_PRESS: self._on_encoder_press,
+            EventType.TOGGLE_GRID: self._on_toggle_grid,
+            EventType.TOGGLE_LEVEL: self._on_toggle_level,
+            EventType.TOGGLE_LANG: self._on_toggle_lang,
+            EventType.FLASH_TOGGLE: self._on_flash_toggle,
+            EventType.SHUTTER_PRESS: self._on_shutter_press,
+            EventType.SHUTDOWN: self._on_shutdown,
+            EventType.BACK: self._on_back,
+        }
+
+    def _schedule(self, name: str, deadline: float):
+        self._deadlines[name] = deadline
+        heapq.heappush(self._timers, (deadline, name))
+
+    @property
+    def idle(self) -> bool:
+        """Nothing time-driven on screen: no pending timer and no animated level line."""
+        return not self._timers and not self.state.level_on
+
+    def tick(self):
+        """Expire scheduled UI state (toasts); free when nothing is pending."""
+        timers = self._timers
+        if not timers:
+            return  # idle fast path: one load + branch, no clock read
+        now = time.perf_counter()
+        while timers and timers[0][0] <= now:
+            deadline, name = heapq.heappop(timers)
+            if self._deadlines.get(name) != deadline:
+                continue  # superseded by a later schedule of the same timer
+            del self._deadlines[name]
+            if name == "toast":
+                self.state.toast = ""
+                self.mark_dirty(self._rect_bottom)
 
     def mark_dirty(self, rect: Tuple[int, int, int, int]):
-        self.state.dirty_rects.append(rect)
+        if self._full_dirty:
+            return  # already redrawing everything
+        rects = self.state.dirty_rects
+        self._dirty_area += rect[2] * rect[3]
+        if self._dirty_area >= self.width * self.height or len(rects) >= _MAX_DIRTY_RECTS:
+            # overlapping/many partial rects would cost more than one full update
+            self.mark_all_dirty()
+            return
+        rects.append(rect)
+
+    def mark_all_dirty(self):
+        if not self._full_dirty:
+            self._full_dirty = True
+            rects = self.state.dirty_rects
+            rects.clear()
+            rects.append(self._rect_full)
 
     def pop_dirty(self) -> List[Tuple[int, int, int, int]]:
-        rects = self.state.dirty_rects[:]
-        self.state.dirty_rects.clear()
+        """Hand out this frame's rects; the list is recycled, so it is only valid until the next call."""
+        s = self.state
+        rects = s.dirty_rects
+        spare = self._spare_rects
+        spare.clear()
+        # swap the two lists instead of copying
+        s.dirty_rects = spare
+        self._spare_rects = rects
+        if not self._full_dirty and len(rects) > 1:
+            _merge_rects(rects)  # blit each pixel once
+        self._full_dirty = False
+        self._dirty_area = 0
         return rects
 
     def handle(self, event: InputEvent):
+        fn = self._dispatch.get(event.type)
+        if not self.measure_latency:
+            if fn is not None:
+                fn(event)
+            return
         t0 = time.perf_counter()
+        if fn is not None:
+            fn(event)
+        self.state.last_input_latency_ms = (time.perf_counter() - t0) * 1000.0
+
+    def drain(self, events: Iterable[InputEvent]) -> List[InputEvent]:
+        """Handle one poll() batch with TOUCH_MOVE runs collapsed to their last event.
+
+        The kept move carries the summed delta of its run. Returns the events actually
+        handled; like pop_dirty(), the list is recycled and only valid until the next call.
+        """
+        batch = self._batch
+        batch.clear()
+        move = None
+        merged = False  # move is our own event, not one of the caller's
+        for ev in events:
+            if ev.type == EventType.TOUCH_MOVE:
+                if move is None:
+                    move = ev
+                elif merged:
+                    move.reset(ev.type, ev.pos, move.delta + ev.delta, ev.timestamp)
+                else:
+                    # one new event per coalesced run; the caller's events are never modified
+                    move = InputEvent(ev.type, ev.pos, move.delta + ev.delta, ev.timestamp)
+                    merged = True
+                continue
+            if move is not None:
+                batch.append(move)
+                move = None
+                merged = False
+            batch.append(ev)
+        if move is not None:
+            batch.append(move)
+        handle = self.handle
+        for ev in batch:
+            handle(ev)
+        return batch
+
+    def _on_touch_down(self, event: InputEvent):
+        self.state.touch_down = True
+
+    def _on_touch_up(self, event: InputEvent):
+        self.state.touch_down = False
+
+    def _on_encoder_detent(self, event: InputEvent):
         s = self.state
+        # sign(delta) without a conditional; a zero delta still steps forward as before
+        step = (event.delta > 0) - (event.delta < 0) or 1
+        s.filter_idx = (s.filter_idx + step) % _N_FILTERS
+        self.mark_dirty(self._rect_top)
+
+    def _on_encoder_press(self, event: InputEvent):
+        s = self.state
+        s.scene = Scene.GALLERY if s.scene == Scene.CAMERA else Scene.CAMERA
+        self.mark_all_dirty()
+
+    def _on_toggle_grid(self, event: InputEvent):
+        self.state.grid_on = not self.state.grid_on
+        self.mark_all_dirty()
+
+    def _on_toggle_level(self, event: InputEvent):
+        self.state.level_on = not self.state.level_on
+        self.mark_all_dirty()
+
+    def _on_toggle_lang(self, event: InputEvent):
+        s = self.state
+        s.set_lang("de" if s.lang == "en" else "en")
+        self._toast_capture = s.t("capture")
+        self.mark_dirty(self._rect_top)
+
+    def _on_flash_toggle(self, event: InputEvent):
+        self.state.flash_on = not self.state.flash_on
+        self.mark_dirty(self._rect_flash)
+
+    def _on_shutter_press(self, event: InputEvent):
+        self.state.toast = self._toast_capture
+        self._schedule("toast", time.perf_counter() + self.toast_sec)
+        self.mark_dirty(self._rect_bottom)
+
+    def _on_shutdown(self, event: InputEvent):
+        self.state.shutdown_requested = True
 
-        if event.type == EventType.ENCODER_DETENT:
-            s.filter_idx = (s.filter_idx + (1 if event.delta >= 0 else -1)) % len(FILTERS)
-            self.mark_dirty((0, 0, self.width, 90))
-        elif event.type == EventType.ENCODER_PRESS:
-            s.scene = Scene.GALLERY if s.scene == Scene.CAMERA else Scene.CAMERA
-            self.mark_dirty((0, 0, self.width, self.height))
-        elif event.type == EventType.TOGGLE_GRID:
-            s.grid_on = not s.grid_on
-            self.mark_dirty((0, 0, self.width, self.height))
-        elif event.type == EventType.TOGGLE_LEVEL:
-            s.level_on = not s.level_on
-            self.mark_dirty((0, 0, self.width, self.height))
-        elif event.type == EventType.TOGGLE_LANG:
-            s.lang = "de" if s.lang == "en" else "en"
-            self.mark_dirty((0, 0, self.width, 90))
-        elif event.type == EventType.FLASH_TOGGLE:
-            s.flash_on = not s.flash_on
-            self.mark_dirty((self.width - 180, 0, 180, 90))
-        elif event.type == EventType.SHUTTER_PRESS:
-            s.toast = s.t("capture")
-            self.mark_dirty((0, self.height - 70, self.width, 70))
-        elif event.type == EventType.SHUTDOWN:
-            s.shutdown_requested = True
-        elif event.type == EventType.BACK:
-            s.scene = Scene.CAMERA
-            self.mark_dirty((0, 0, self.width, self.height))
-        elif event.type == EventType.TOUCH_DOWN:
-            s.touch_down = True
-        elif event.type == EventType.TOUCH_UP:
-            s.touch_down = False
-
-        s.last_input_latency_ms = (time.perf_counter() - t0) * 1000.0
+    def _on_back(self, event: InputEvent):
+        self.state.scene = Scene.CAMERA
+        self.mark_all_dirty()
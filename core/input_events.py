@@ -2,29 +2,54 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from enum import Enum, auto
+from enum import IntEnum
 from typing import Tuple
 
 
-class EventType(Enum):
-    TOUCH_DOWN = auto()
-    TOUCH_MOVE = auto()
-    TOUCH_UP = auto()
-    ENCODER_DETENT = auto()
-    ENCODER_PRESS = auto()
-    SHUTTER_PRESS = auto()
-    SHUTDOWN = auto()
-    FLASH_TOGGLE = auto()
-    TOGGLE_GRID = auto()
-    TOGGLE_LEVEL = auto()
-    TOGGLE_LANG = auto()
-    BACK = auto()
+class EventType(IntEnum):
+    # IntEnum: hashing/equality are plain int ops (C), which keeps controller dispatch cheap
+    TOUCH_DOWN = 1
+    TOUCH_MOVE = 2
+    TOUCH_UP = 3
+    ENCODER_DETENT = 4
+    ENCODER_PRESS = 5
+    SHUTTER_PRESS = 6
+    SHUTDOWN = 7
+    FLASH_TOGGLE = 8
+    TOGGLE_GRID = 9
+    TOGGLE_LEVEL = 10
+    TOGGLE_LANG = 11
+    BACK = 12
 
 
-@dataclass(frozen=True)
 class InputEvent:
-    type: EventType
-    pos: Tuple[int, int] = (0, 0)
-    delta: int = 0
-    timestamp: float = 0.0
+    """Mutable, slotted event record so adapters can recycle instances from a pool."""
+
+    __slots__ = ("type", "pos", "delta", "timestamp")
+
+    def __init__(self, type: EventType, pos: Tuple[int, int] = (0, 0), delta: int = 0, timestamp: float = 0.0):
+        self.type = type
+        self.pos = pos
+        self.delta = delta
+        self.timestamp = timestamp
+
+    def reset(self, type: EventType, pos: Tuple[int, int] = (0, 0), delta: int = 0, timestamp: float = 0.0) -> "InputEvent":
+        self.type = type
+        self.pos = pos
+        self.delta = delta
+        self.timestamp = timestamp
+        return self
+
+    def copy(self) -> "InputEvent":
+        """Detached snapshot for consumers that keep an event past the next poll()."""
+        return InputEvent(self.type, self.pos, self.delta, self.timestamp)
+
+    def __eq__(self, other):
+        if not isinstance(other, InputEvent):
+            return NotImplemented
+        return (self.type, self.pos, self.delta, self.timestamp) == (other.type, other.pos, other.delta, other.timestamp)
+
+    __hash__ = None  # mutable
+
+    def __repr__(self) -> str:
+        return f"InputEvent(type={self.type}, pos={self.pos}, delta={self.delta}, timestamp={self.timestamp})"
@@ -5,11 +5,13 @@ from __future__ import annotations
 import math
 import time
 from dataclasses import dataclass
-from typing import List, Tuple
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
 import pygame
 
-from core.app_controller import AppState, Scene
+from core.app_controller import FILTERS, AppState, Scene
+from core.i18n import I18N
 
 # UI_TOKENS: HOW TO CHANGE -> adjust color tuple constants below to reskin matte theme globally.
 C_BG = (18, 18, 22)
@@ -26,8 +28,9 @@ BOTTOM_H = 64
 SIDEBAR_W = 220
 ICON_SIZE = 20
 
-# UI_MOTION: HOW TO CHANGE -> tweak timings/easing to make interaction snappier/slower.
-TOAST_SEC = 0.6
+# icon sprites are (2 * _ICON_R) px square around the icon center; _ICON_KEY marks transparency
+_ICON_R = 12
+_ICON_KEY = (0, 0, 0)
 
 # UI_TOUCH: HOW TO CHANGE -> increase touch box for gloves or smaller screens.
 TOUCH_HITBOX = 48
@@ -35,11 +38,35 @@ TOUCH_HITBOX = 48
 # UI_TEXT: HOW TO CHANGE -> adjust label sizes/faces via font table in build_fonts().
 FONT_SIZES = {"s": 14, "m": 18, "l": 24}
 
+# rendered label surfaces kept per renderer; least recently used entries are evicted beyond this
+_TEXT_CACHE_MAX = 256
+
+# pygame-ce: fblits() takes the batch without building a result list; pygame: blits(doreturn=False)
+_HAS_FBLITS = hasattr(pygame.Surface, "fblits")
+
+
+@lru_cache(maxsize=None)
+def _font_spec(name: str, bold: bool = False) -> Tuple[Optional[str], bool]:
+    """SysFont's path resolution and style fallback, once per face for all renderers.
+
+    Only (path, fake_bold) is cached: Font objects die with pygame.quit(), plain data does not.
+    """
+    return pygame.font.SysFont(name, 0, bold=bold, constructor=lambda path, _size, fake_bold, _italic: (path, fake_bold))
+
+
+def _sys_font(name: str, size: int, bold: bool = False) -> pygame.font.Font:
+    path, fake_bold = _font_spec(name, bold)
+    font = pygame.font.Font(path, size)
+    if fake_bold:
+        font.set_bold(True)
+    return font
+
 
 @dataclass
 class RenderStats:
     frame_ms: float = 0.0
     dirty_count: int = 0
+    skipped: bool = False  # nothing visible changed; screen left as is, no display update needed
 
 
 class UIRenderer:
@@ -48,76 +75,161 @@ class UIRenderer:
         self.width = width
         self.height = height
         self.fonts = self.build_fonts()
-        self.last_toast_time = 0.0
+        # (font key, text, color) -> rendered surface; most labels repeat every frame
+        self._text_cache: Dict[tuple, pygame.Surface] = {}
+        self._icon_cache: Dict[tuple, pygame.Surface] = {}
+        self._grid_overlay = self._build_grid_overlay()
+        # fixed labels for every language, rasterized up front (no stall on the first lang toggle)
+        self._lang_labels = {lang: self._build_labels(lang) for lang in I18N}
+        # fingerprint of everything the last drawn frame depended on besides the viewfinder
+        self._last_fp: Optional[tuple] = None
 
     def build_fonts(self):
         return {
-            "s": pygame.font.SysFont("Arial", FONT_SIZES["s"]),
-            "m": pygame.font.SysFont("Arial", FONT_SIZES["m"]),
-            "l": pygame.font.SysFont("Arial", FONT_SIZES["l"], bold=True),
+            "s": _sys_font("Arial", FONT_SIZES["s"]),
+            "m": _sys_font("Arial", FONT_SIZES["m"]),
+            "l": _sys_font("Arial", FONT_SIZES["l"], bold=True),
         }
 
+    def _build_grid_overlay(self) -> pygame.Surface:
+        """Grid lines baked once into a colorkeyed, RLE-accelerated surface: one blit per frame."""
+        surf = pygame.Surface((self.width, self.height), 0, self.screen)
+        surf.fill((0, 0, 0))
+        for x in range(0, self.width, 80):
+            pygame.draw.line(surf, (70, 70, 75), (x, 0), (x, self.height), 1)
+        for y in range(0, self.height, 80):
+            pygame.draw.line(surf, (70, 70, 75), (0, y), (self.width, y), 1)
+        # RLE skips the transparent runs entirely instead of testing every pixel
+        surf.set_colorkey((0, 0, 0), pygame.RLEACCEL)
+        return surf
+
     # UI_ICON: HOW TO CHANGE -> edit primitive geometry for icons; no external assets needed.
-    def draw_icon(self, name: str, center: Tuple[int, int], color):
+    @staticmethod
+    def _draw_icon_shapes(surf: pygame.Surface, name: str, center: Tuple[int, int], color):
         x, y = center
         if name == "grid":
             for i in (-6, 0, 6):
-                pygame.draw.line(self.screen, color, (x - 8, y + i), (x + 8, y + i), 1)
-                pygame.draw.line(self.screen, color, (x + i, y - 8), (x + i, y + 8), 1)
+                pygame.draw.line(surf, color, (x - 8, y + i), (x + 8, y + i), 1)
+                pygame.draw.line(surf, color, (x + i, y - 8), (x + i, y + 8), 1)
         elif name == "level":
-            pygame.draw.line(self.screen, color, (x - 10, y), (x + 10, y), 2)
-            pygame.draw.circle(self.screen, color, (x, y), 3, 1)
+            pygame.draw.line(surf, color, (x - 10, y), (x + 10, y), 2)
+            pygame.draw.circle(surf, color, (x, y), 3, 1)
         elif name == "flash":
             pts = [(x - 4, y - 9), (x + 2, y - 2), (x - 1, y - 2), (x + 4, y + 9), (x - 2, y + 2), (x + 1, y + 2)]
-            pygame.draw.lines(self.screen, color, False, pts, 2)
+            pygame.draw.lines(surf, color, False, pts, 2)
+
+    def draw_icon(self, name: str, center: Tuple[int, int], color):
+        # each (icon, color) is drawn once into a small colorkeyed sprite, then it is one blit
+        ck = (name, color)
+        sprite = self._icon_cache.get(ck)
+        if sprite is None:
+            sprite = pygame.Surface((2 * _ICON_R, 2 * _ICON_R), 0, self.screen)
+            sprite.fill(_ICON_KEY)
+            self._draw_icon_shapes(sprite, name, (_ICON_R, _ICON_R), color)
+            sprite.set_colorkey(_ICON_KEY, pygame.RLEACCEL)
+            self._icon_cache[ck] = sprite
+        self.screen.blit(sprite, (center[0] - _ICON_R, center[1] - _ICON_R))
+
+    def _label(self, key: str, text: str, color) -> pygame.Surface:
+        cache = self._text_cache
+        ck = (key, text, color)
+        surf = cache.pop(ck, None)
+        if surf is None:
+            if len(cache) >= _TEXT_CACHE_MAX:
+                del cache[next(iter(cache))]  # dicts keep insertion order: drop the least recent
+            # display pixel format: cached labels blit on SDL's fast same-format path
+            surf = self.fonts[key].render(text, True, color).convert_alpha()
+        # (re)inserted at the end: a churning debug readout cannot push out labels still in use
+        cache[ck] = surf
+        return surf
+
+    def _build_labels(self, lang: str) -> Dict[str, object]:
+        """Pre-rendered surfaces for the text that depends only on language (and filter index)."""
+        strings = I18N[lang]
+
+        def t(key: str) -> str:
+            return strings.get(key, key)  # same fallback as AppState.t
+
+        label = self._label
+        return {
+            "header": tuple(
+                label("m", f"{t('mode')}  {t('filter')}: {name.upper()}", C_TEXT) for name in FILTERS
+            ),
+            "grid": label("s", t("grid"), C_TEXT),
+            "level": label("s", t("level"), C_TEXT),
+            "lang": label("s", f"{t('lang')}: {lang.upper()}", C_TEXT),
+            "status": label("s", f"{t('status')}: {t('ready')}", C_MUTED),
+            "capture": label("m", t("capture"), C_TEXT),
+            "gallery": label("m", t("gallery"), C_TEXT),
+        }
 
     def _text(self, key: str, text: str, color, pos):
-        surf = self.fonts[key].render(text, True, color)
-        self.screen.blit(surf, pos)
+        self.screen.blit(self._label(key, text, color), pos)
 
-    def render(self, state: AppState, frame: pygame.Surface, show_debug: bool = False) -> RenderStats:
+    def _blit_batch(self, seq):
+        """Blit (surface, pos) pairs in one call instead of one Python->C crossing each."""
+        if _HAS_FBLITS:
+            self.screen.fblits(seq)
+        else:
+            self.screen.blits(seq, doreturn=False)
+
+    def render(self, state: AppState, frame: pygame.Surface, show_debug: bool = False,
+               now: Optional[float] = None, frame_changed: bool = True) -> RenderStats:
+        """Draw one frame. `now` is the caller's frame time (perf_counter) for animations.
+
+        With frame_changed=False (static viewfinder) the whole frame is skipped when no
+        render-relevant state differs from the last drawn one; see RenderStats.skipped.
+        """
         t0 = time.perf_counter()
+        if now is None:
+            now = t0
+        # plain math.sin: in CPython a sine table costs more (int() + mask + index ~100 ns vs ~40 ns)
+        level_y = int(self.height * 0.5 + math.sin(now * 2.0) * 2.0) if state.level_on else -1
+        fp = (
+            state.lang, state.filter_idx, state.flash_on, state.grid_on, level_y, state.scene, state.toast,
+            (state.last_input_latency_ms, len(state.dirty_rects)) if show_debug else None,
+        )
+        if not frame_changed and fp == self._last_fp:
+            return RenderStats(skipped=True)
+        self._last_fp = fp
 
         # viewfinder fast path (already prepared frame surface)
         self.screen.blit(frame, (0, 0))
 
+        labels = self._lang_labels[state.lang]
+
         # top matte bar
         pygame.draw.rect(self.screen, C_PANEL, (0, 0, self.width, TOP_H))
-        self._text("m", f"{state.t('mode')}  {state.t('filter')}: {state.filter_name.upper()}", C_TEXT, (PAD, 16))
+        self.screen.blit(labels["header"][state.filter_idx], (PAD, 16))
         flash_color = C_ACCENT if state.flash_on else C_MUTED
         self.draw_icon("flash", (self.width - 30, 28), flash_color)
 
         # left matte sidebar
         pygame.draw.rect(self.screen, C_PANEL, (0, TOP_H, SIDEBAR_W, self.height - TOP_H - BOTTOM_H))
         self.draw_icon("grid", (30, TOP_H + 28), C_OK if state.grid_on else C_MUTED)
-        self._text("s", state.t("grid"), C_TEXT, (52, TOP_H + 20))
         self.draw_icon("level", (30, TOP_H + 70), C_OK if state.level_on else C_MUTED)
-        self._text("s", state.t("level"), C_TEXT, (52, TOP_H + 62))
-        self._text("s", f"{state.t('lang')}: {state.lang.upper()}", C_TEXT, (22, TOP_H + 104))
-        self._text("s", f"{state.t('status')}: {state.t('ready')}", C_MUTED, (22, TOP_H + 134))
+        # labels do not overlap the icons, so they go out as one batch
+        self._blit_batch((
+            (labels["grid"], (52, TOP_H + 20)),
+            (labels["level"], (52, TOP_H + 62)),
+            (labels["lang"], (22, TOP_H + 104)),
+            (labels["status"], (22, TOP_H + 134)),
+        ))
 
         # overlay helpers
         if state.grid_on:
-            for x in range(0, self.width, 80):
-                pygame.draw.line(self.screen, (70, 70, 75), (x, 0), (x, self.height), 1)
-            for y in range(0, self.height, 80):
-                pygame.draw.line(self.screen, (70, 70, 75), (0, y), (self.width, y), 1)
+            self.screen.blit(self._grid_overlay, (0, 0))
 
         if state.level_on:
-            y = int(self.height * 0.5 + math.sin(time.perf_counter() * 2.0) * 2.0)
-            pygame.draw.line(self.screen, C_ACCENT, (SIDEBAR_W + 20, y), (self.width - 20, y), 2)
+            pygame.draw.line(self.screen, C_ACCENT, (SIDEBAR_W + 20, level_y), (self.width - 20, level_y), 2)
 
         # bottom bar
         pygame.draw.rect(self.screen, C_PANEL, (0, self.height - BOTTOM_H, self.width, BOTTOM_H))
-        scene_label = state.t("gallery") if state.scene == Scene.GALLERY else state.t("capture")
-        self._text("m", scene_label, C_TEXT, (PAD, self.height - 42))
+        scene_label = labels["gallery"] if state.scene == Scene.GALLERY else labels["capture"]
+        self.screen.blit(scene_label, (PAD, self.height - 42))
         if state.toast:
+            # expiry: AppController.tick()
             self._text("m", state.toast, C_ACCENT, (self.width // 2 - 50, self.height - 42))
-            if self.last_toast_time == 0.0:
-                self.last_toast_time = time.perf_counter()
-            if time.perf_counter() - self.last_toast_time > TOAST_SEC:
-                state.toast = ""
-                self.last_toast_time = 0.0
 
         if show_debug:
             pygame.draw.rect(self.screen, (0, 0, 0), (self.width - 260, 8, 252, 72))
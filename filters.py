@@ -75,6 +75,11 @@ class BaseFilter:
         """Apply filter in-place (modifies original)"""
         result = self.apply(image, strength)
         np.copyto(image, result)
+    
+    def apply_into(self, image: np.ndarray, out: np.ndarray, strength: float = 1.0) -> np.ndarray:
+        """Apply filter writing into a caller-owned buffer (same shape/dtype as image)"""
+        np.copyto(out, self.apply(image, strength))
+        return out
 
 
 # ============================================================================
@@ -102,6 +107,7 @@ class LUTFilter(BaseFilter):
         super().__init__(name, FilterType.COLOR)
         self.lut = lut
         self.lut_size = lut.shape[0]
+        self._lut_flat = lut.reshape(-1, 3)
     
     def apply(self, image: np.ndarray, strength: float = 1.0) -> np.ndarray:
         """Apply LUT"""
@@ -121,111 +127,90 @@ class LUTFilter(BaseFilter):
             filtered = (image * (1 - strength) + filtered * strength).astype(np.uint8)
         
         return filtered.astype(np.uint8)
+    
+    def apply_into(self, image: np.ndarray, out: np.ndarray, strength: float = 1.0) -> np.ndarray:
+        """Apply LUT straight into out (no full-size result allocation at full strength)"""
+        if strength < 1.0:
+            return super().apply_into(image, out, strength)
+        
+        scale = (self.lut_size - 1) / 255.0
+        size = self.lut_size
+        idx = (image[:, :, 0] * scale).astype(np.int32)
+        idx *= size
+        idx += (image[:, :, 1] * scale).astype(np.int32)
+        idx *= size
+        idx += (image[:, :, 2] * scale).astype(np.int32)
+        
+        np.take(self._lut_flat, idx, axis=0, out=out)
+        return out
+
+
+def _lut_axes(size: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Normalized r/g/b grid coordinates (0-1), shaped to broadcast over a (size, size, size) cube"""
+    axis = np.arange(size, dtype=np.float64) / (size - 1)
+    return axis[:, None, None], axis[None, :, None], axis[None, None, :]
+
+
+def _pack_lut(r_out: np.ndarray, g_out: np.ndarray, b_out: np.ndarray, size: int) -> np.ndarray:
+    """Stack 0-1 channel cubes into a uint8 LUT (truncating like int(x * 255))"""
+    lut = np.empty((size, size, size, 3), dtype=np.uint8)
+    for c, chan in enumerate((r_out, g_out, b_out)):
+        lut[..., c] = np.broadcast_to(chan * 255, (size, size, size))
+    return lut
 
 
 def create_vintage_lut(size: int = 32) -> np.ndarray:
     """Create vintage film-look LUT"""
-    lut = np.zeros((size, size, size, 3), dtype=np.uint8)
-    
-    for r in range(size):
-        for g in range(size):
-            for b in range(size):
-                # Normalize to 0-1
-                r_norm = r / (size - 1)
-                g_norm = g / (size - 1)
-                b_norm = b / (size - 1)
-                
-                # Vintage curve: lift blacks, crush highlights
-                r_out = r_norm * 0.9 + 0.1
-                g_out = g_norm * 0.9 + 0.08
-                b_out = b_norm * 0.85 + 0.1
-                
-                # Warm tone (add yellow)
-                r_out = min(1.0, r_out * 1.1)
-                g_out = min(1.0, g_out * 1.05)
-                b_out = b_out * 0.95
-                
-                # S-curve for contrast
-                r_out = 3 * r_out**2 - 2 * r_out**3
-                g_out = 3 * g_out**2 - 2 * g_out**3
-                b_out = 3 * b_out**2 - 2 * b_out**3
-                
-                lut[r, g, b] = (
-                    int(r_out * 255),
-                    int(g_out * 255),
-                    int(b_out * 255)
-                )
+    r_norm, g_norm, b_norm = _lut_axes(size)
     
-    return lut
+    # Vintage curve: lift blacks, crush highlights
+    r_out = r_norm * 0.9 + 0.1
+    g_out = g_norm * 0.9 + 0.08
+    b_out = b_norm * 0.85 + 0.1
+    
+    # Warm tone (add yellow)
+    r_out = np.minimum(1.0, r_out * 1.1)
+    g_out = np.minimum(1.0, g_out * 1.05)
+    b_out = b_out * 0.95
+    
+    # S-curve for contrast
+    r_out = 3 * r_out**2 - 2 * r_out**3
+    g_out = 3 * g_out**2 - 2 * g_out**3
+    b_out = 3 * b_out**2 - 2 * b_out**3
+    
+    return _pack_lut(r_out, g_out, b_out, size)
 
 
 def create_bw_lut(size: int = 32) -> np.ndarray:
     """Create B&W LUT with warm tone"""
-    lut = np.zeros((size, size, size, 3), dtype=np.uint8)
-    
-    for r in range(size):
-        for g in range(size):
-            for b in range(size):
-                r_norm = r / (size - 1)
-                g_norm = g / (size - 1)
-                b_norm = b / (size - 1)
-                
-                # Weighted grayscale (perceptual)
-                gray = 0.299 * r_norm + 0.587 * g_norm + 0.114 * b_norm
-                
-                # Warm B&W (sepia-ish)
-                r_out = min(1.0, gray * 1.05)
-                g_out = gray
-                b_out = gray * 0.95
-                
-                lut[r, g, b] = (
-                    int(r_out * 255),
-                    int(g_out * 255),
-                    int(b_out * 255)
-                )
+    r_norm, g_norm, b_norm = _lut_axes(size)
     
-    return lut
+    # Weighted grayscale (perceptual)
+    gray = 0.299 * r_norm + 0.587 * g_norm + 0.114 * b_norm
+    
+    # Warm B&W (sepia-ish)
+    return _pack_lut(np.minimum(1.0, gray * 1.05), gray, gray * 0.95, size)
 
 
 def create_vivid_lut(size: int = 32) -> np.ndarray:
     """Create vivid/saturated LUT"""
-    lut = np.zeros((size, size, size, 3), dtype=np.uint8)
-    
-    for r in range(size):
-        for g in range(size):
-            for b in range(size):
-                r_norm = r / (size - 1)
-                g_norm = g / (size - 1)
-                b_norm = b / (size - 1)
-                
-                # Increase saturation
-                # Convert to HSV-like, boost saturation
-                max_val = max(r_norm, g_norm, b_norm)
-                min_val = min(r_norm, g_norm, b_norm)
-                delta = max_val - min_val
-                
-                if delta > 0:
-                    # Boost saturation by 30%
-                    boost = 1.3
-                    
-                    r_out = max_val + (r_norm - max_val) * boost
-                    g_out = max_val + (g_norm - max_val) * boost
-                    b_out = max_val + (b_norm - max_val) * boost
-                    
-                    # Clamp
-                    r_out = max(0.0, min(1.0, r_out))
-                    g_out = max(0.0, min(1.0, g_out))
-                    b_out = max(0.0, min(1.0, b_out))
-                else:
-                    r_out, g_out, b_out = r_norm, g_norm, b_norm
-                
-                lut[r, g, b] = (
-                    int(r_out * 255),
-                    int(g_out * 255),
-                    int(b_out * 255)
-                )
+    r_norm, g_norm, b_norm = np.broadcast_arrays(*_lut_axes(size))
     
-    return lut
+    # Increase saturation
+    # Convert to HSV-like, boost saturation
+    max_val = np.maximum(np.maximum(r_norm, g_norm), b_norm)
+    min_val = np.minimum(np.minimum(r_norm, g_norm), b_norm)
+    delta = max_val - min_val
+    
+    # Boost saturation by 30% (gray cells, delta == 0, pass through unchanged)
+    boost = 1.3
+    chroma = delta > 0
+    
+    def _boost(chan: np.ndarray) -> np.ndarray:
+        out = np.clip(max_val + (chan - max_val) * boost, 0.0, 1.0)
+        return np.where(chroma, out, chan)
+    
+    return _pack_lut(_boost(r_norm), _boost(g_norm), _boost(b_norm), size)
 
 
 # ============================================================================
@@ -365,7 +350,8 @@ class FilterManager:
         
         logger.info(f"Filters initialized: {len(self.filters)} filters, {len(self.presets)} presets")
     
-    def apply_filter(self, image: np.ndarray, filter_name: str, strength: float = 1.0) -> np.ndarray:
+    def apply_filter(self, image: np.ndarray, filter_name: str, strength: float = 1.0,
+                     out: Optional[np.ndarray] = None) -> np.ndarray:
         """
         Apply single filter
         
@@ -373,15 +359,18 @@ class FilterManager:
             image: Input image
             filter_name: Name of filter
             strength: Filter strength 0.0-1.0
+            out: Optional pre-allocated result buffer (same shape/dtype as image)
         
         Returns:
-            Filtered image
+            Filtered image (out, if given)
         """
         if filter_name not in self.filters:
             logger.warning(f"Unknown filter: {filter_name}")
             return image
         
         filter_obj = self.filters[filter_name]
+        if out is not None:
+            return filter_obj.apply_into(image, out, strength)
         return filter_obj.apply(image, strength)
     
     def apply_preset(self, image: np.ndarray, preset_name: str) -> np.ndarray:
@@ -407,6 +396,12 @@ class FilterManager:
         
         return result
     
+    def prewarm(self, shape: Tuple[int, int] = (8, 8)):
+        """Touch every filter once so first-call setup stays out of timed/interactive paths"""
+        probe = np.zeros((shape[0], shape[1], 3), dtype=np.uint8)
+        for filter_obj in self.filters.values():
+            filter_obj.apply(probe)
+    
     def get_available_filters(self) -> List[str]:
         """Get list of available filters"""
         return list(self.filters.keys())
@@ -474,16 +469,25 @@ if __name__ == "__main__":
     print(f"Available filters: {manager.get_available_filters()}")
     print(f"Available presets: {manager.get_available_presets()}")
     
-    # Benchmark filters
+    # Benchmark filters (result buffer reused, GC paused so pauses don't skew timings)
+    import gc
     import time
     
+    out = np.empty_like(test_image)
+    
     for filter_name in ['vintage', 'bw', 'vivid']:
+        # Warmup (untimed)
+        for _ in range(3):
+            manager.apply_filter(test_image, filter_name, out=out)
+        
+        gc.disable()
         start = time.perf_counter()
         
         for _ in range(10):
-            filtered = manager.apply_filter(test_image, filter_name)
+            manager.apply_filter(test_image, filter_name, out=out)
         
         elapsed = (time.perf_counter() - start) / 10.0 * 1000.0
+        gc.enable()
         
         print(f"{filter_name:12s}: {elapsed:.2f} ms/frame @ 640x480")
     
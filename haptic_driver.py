@@ -411,7 +411,9 @@ class HapticController:
             # Adaptive amplitude
             # Slow turns (< 2 detents/sec): Full amplitude
             # Fast turns (> 10 detents/sec): 30% amplitude
-            speed_factor = max(0.3, min(1.0, 1.0 - (self.rotation_speed - 2.0) / 8.0))
+            # clamp to [0.3, 1.0] with comparisons: no builtin calls per detent
+            speed_factor = 1.0 - (self.rotation_speed - 2.0) / 8.0
+            speed_factor = 0.3 if speed_factor < 0.3 else (1.0 if speed_factor > 1.0 else speed_factor)
             amplitude = speed_factor
         else:
             amplitude = 1.0
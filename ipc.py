@@ -17,7 +17,6 @@ Author: SelimCam Team
 License: MIT
 """
 
-import zmq
 import time
 import multiprocessing as mp
 from multiprocessing import shared_memory
@@ -28,6 +27,11 @@ import pickle
 import numpy as np
 from queue import Empty
 
+try:
+    import zmq
+except ImportError:  # pragma: no cover - shared-memory frames work without ZeroMQ
+    zmq = None
+
 
 class MessageType(Enum):
     """IPC message types"""
@@ -92,24 +96,26 @@ class SharedFrameBuffer:
     
     Design:
     - Fixed-size buffer for preview frames
-    - Ping-pong buffering (2 buffers)
-    - Lock-free reading (atomic buffer swapping)
+    - Triple buffering: writer fills the slot after the published one, so a
+      reader keeps a stable view for two further frames
+    - Lock-free reading (atomic index publish), no pickling across processes
     - Camera writes, UI reads
     
     Memory layout:
-    [width][height][current_buffer_idx][buffer_A][buffer_B]
+    [width][height][current_slot_idx][frame_seq][pad to 64 B][slot_0][slot_1][slot_2]
     """
     
+    SLOTS = 3
+    
     def __init__(self, width: int, height: int, name: str = "selimcam_frame"):
         self.width = width
         self.height = height
         self.channels = 3  # RGB
         self.frame_size = width * height * self.channels
         
-        # Total size: metadata + 2 buffers
-        # [4 bytes width][4 bytes height][4 bytes idx][buffer_A][buffer_B]
-        metadata_size = 12  # 3 int32s
-        total_size = metadata_size + (self.frame_size * 2)
+        # Total size: metadata (own cache line, no false sharing with pixel data) + slots
+        metadata_size = 64
+        total_size = metadata_size + (self.frame_size * self.SLOTS)
         
         # Create or attach to shared memory
         try:
@@ -131,76 +137,86 @@ class SharedFrameBuffer:
         """Setup numpy buffer views"""
         # Metadata view
         self.metadata = np.ndarray(
-            (3,), dtype=np.int32, buffer=self.shm.buf, offset=0
+            (4,), dtype=np.int32, buffer=self.shm.buf, offset=0
         )
         
-        # Buffer A
-        offset_a = self.metadata_size
-        self.buffer_a = np.ndarray(
-            (self.height, self.width, self.channels),
-            dtype=np.uint8,
-            buffer=self.shm.buf,
-            offset=offset_a
-        )
-        
-        # Buffer B
-        offset_b = self.metadata_size + self.frame_size
-        self.buffer_b = np.ndarray(
-            (self.height, self.width, self.channels),
-            dtype=np.uint8,
-            buffer=self.shm.buf,
-            offset=offset_b
-        )
+        shape = (self.height, self.width, self.channels)
+        self.slots = []
+        self._read_views = []
+        for i in range(self.SLOTS):
+            offset = self.metadata_size + i * self.frame_size
+            self.slots.append(np.ndarray(shape, dtype=np.uint8, buffer=self.shm.buf, offset=offset))
+            view = np.ndarray(shape, dtype=np.uint8, buffer=self.shm.buf, offset=offset)
+            view.flags.writeable = False
+            self._read_views.append(view)
     
     def _write_metadata(self, width: int, height: int, current_idx: int):
-        """Write metadata (width, height, current buffer index)"""
-        meta = np.ndarray((3,), dtype=np.int32, buffer=self.shm.buf, offset=0)
+        """Write metadata (width, height, current buffer index, frame sequence)"""
+        meta = np.ndarray((4,), dtype=np.int32, buffer=self.shm.buf, offset=0)
         meta[0] = width
         meta[1] = height
         meta[2] = current_idx
+        meta[3] = 0
     
     def write_frame(self, frame: np.ndarray) -> bool:
         """
         Write frame to inactive buffer and swap (writer only)
         
         Args:
-            frame: RGB frame (height, width, 3)
+            frame: RGB frame (height, width, 3); ndarray or memoryview
         
         Returns:
             True if successful
         """
         if frame.shape != (self.height, self.width, self.channels):
             return False
-        
-        # Get current active buffer
-        current_idx = int(self.metadata[2])
-        
-        # Write to inactive buffer
-        if current_idx == 0:
-            np.copyto(self.buffer_b, frame)
-            new_idx = 1
-        else:
-            np.copyto(self.buffer_a, frame)
-            new_idx = 0
-        
-        # Atomic swap
-        self.metadata[2] = new_idx
-        
+        self.commit_frame(frame)
         return True
     
-    def read_frame(self) -> Optional[np.ndarray]:
+    def commit_frame(self, src) -> int:
+        """
+        Copy, publish and count a frame in one pass (writer only)
+        
+        Args:
+            src: (>=height, >=width, 3) array, e.g. a mapped libcamera buffer
+                 whose rows carry stride padding; cropped without an extra copy
+        
+        Returns:
+            New frame sequence number (readers compare it to detect new frames)
+        """
+        meta = self.metadata
+        new_idx = (int(meta[2]) + 1) % self.SLOTS
+        slot = self.slots[new_idx]
+        if src.shape != slot.shape:
+            src = src[:self.height, :self.width]
+        np.copyto(slot, src)
+        # Atomic publish, then bump the sequence readers poll on
+        meta[2] = new_idx
+        seq = (int(meta[3]) + 1) & 0x7FFFFFFF
+        meta[3] = seq
+        return seq
+    
+    @property
+    def sequence(self) -> int:
+        """Frames committed so far (wraps at 2**31)"""
+        return int(self.metadata[3])
+    
+    def read_frame(self, into: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
         """
         Read current active frame (reader only)
         
+        Args:
+            into: Optional pre-allocated (height, width, 3) uint8 destination
+        
         Returns:
-            View of current frame (DO NOT MODIFY!)
+            Read-only view of current frame, or `into` filled with a copy
         """
-        current_idx = int(self.metadata[2])
+        active = self._read_views[int(self.metadata[2])]
+        if into is None:
+            return active
         
-        if current_idx == 0:
-            return self.buffer_a
-        else:
-            return self.buffer_b
+        np.copyto(into, active)
+        return into
     
     def cleanup(self):
         """Cleanup shared memory"""
@@ -230,6 +246,9 @@ class ZMQChannel:
             pattern: 'pubsub', 'reqrep', 'pushpull'
             endpoint: e.g. 'tcp://127.0.0.1:5555' or 'ipc:///tmp/selimcam.sock'
         """
+        if zmq is None:
+            raise RuntimeError("pyzmq is required for ZMQChannel")
+        
         self.role = role
         self.pattern = pattern
         self.endpoint = endpoint
@@ -383,11 +402,11 @@ class IPCManager:
         # Event queue (for hardware)
         self.event_queue = EventQueue() if role == 'hardware' else None
     
-    def send_frame_ready(self):
-        """Notify that new frame is ready (camera only)"""
+    def send_frame_ready(self, count: int = 1):
+        """Notify that new frame(s) are ready (camera only); data = frames since last notify"""
         if 'frame_pub' in self.channels:
             self.channels['frame_pub'].send(
-                IPCMessage(MessageType.FRAME_READY, source='camera')
+                IPCMessage(MessageType.FRAME_READY, count, source='camera')
             )
     
     def send_command(self, msg_type: MessageType, data: Any = None) -> Optional[IPCMessage]:
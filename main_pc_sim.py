@@ -5,11 +5,19 @@ from __future__ import annotations
 
 import json
 import time
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional
 
 import pygame
 
+try:
+    import numpy as np
+except Exception:  # pragma: no cover
+    np = None
+
 from core.app_controller import AppController
+from core.input_events import EventType
 from core.ui_renderer import UIRenderer
 from adapters.pc_io import PCIOAdapter
 
@@ -24,12 +32,43 @@ def _load_config() -> dict:
     return {}
 
 
-def make_frame_surface(width: int, height: int, tick: float) -> pygame.Surface:
+@lru_cache(maxsize=2)
+def _background(width: int, height: int) -> pygame.Surface:
+    """Static vertical gradient under the placeholder frame; built once per size."""
     surf = pygame.Surface((width, height))
+    if np is not None:
+        # one bulk copy instead of a draw.line per scanline
+        c = (20 + 40 * (np.arange(height) / max(1, height))).astype(np.int32)
+        col = np.stack([c, c, c + 10], axis=-1)
+        pygame.surfarray.blit_array(surf, np.broadcast_to(col[None, :, :], (width, height, 3)))
+        return surf
     for y in range(height):
         c = int(20 + 40 * (y / max(1, height)))
         pygame.draw.line(surf, (c, c, c + 10), (0, y), (width, y))
-    pygame.draw.circle(surf, (120, 120, 160), (width // 2, height // 2), 32 + int(8 * (tick % 1.0)))
+    return surf
+
+
+class _PlaceholderFrame:
+    """Reused frame surface; per frame only the area under the last animated shape is restored."""
+
+    def __init__(self, width: int, height: int):
+        self.background = _background(width, height)
+        self.surf = self.background.copy()
+        self.dirty: Optional[pygame.Rect] = None
+
+
+@lru_cache(maxsize=2)
+def _placeholder(width: int, height: int) -> _PlaceholderFrame:
+    return _PlaceholderFrame(width, height)
+
+
+def make_frame_surface(width: int, height: int, tick: float) -> pygame.Surface:
+    """Animated placeholder viewfinder; the returned surface is reused by the next call."""
+    frame = _placeholder(width, height)
+    surf = frame.surf
+    if frame.dirty is not None:
+        surf.blit(frame.background, frame.dirty, frame.dirty)
+    frame.dirty = pygame.draw.circle(surf, (120, 120, 160), (width // 2, height // 2), 32 + int(8 * (tick % 1.0)))
     return surf
 
 
@@ -51,15 +90,16 @@ def main():
 
     running = True
     while running:
-        for ev in io.poll():
-            if ev.type.name == "SHUTDOWN":
-                running = False
-            controller.handle(ev)
-            if ev.type.name == "ENCODER_PRESS":
+        for ev in controller.drain(io.poll()):
+            if ev.type == EventType.ENCODER_PRESS:
                 debug_overlay = not debug_overlay
+                controller.measure_latency = debug_overlay
+        running = not controller.state.shutdown_requested
+        controller.tick()
 
-        frame = make_frame_surface(width, height, time.perf_counter())
-        _stats = renderer.render(controller.state, frame, show_debug=debug_overlay)
+        now = time.perf_counter()  # one clock read drives the frame and its animations
+        frame = make_frame_surface(width, height, now)
+        _stats = renderer.render(controller.state, frame, show_debug=debug_overlay, now=now)
         rects = controller.pop_dirty()
         renderer.dirty_or_full(rects)
         clock.tick(fps)
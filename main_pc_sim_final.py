@@ -29,6 +29,7 @@ Author: SelimCam Team
 License: MIT
 """
 
+import math
 import pygame
 import time
 import numpy as np
@@ -51,6 +52,7 @@ from filters import FilterManager
 RES_W, RES_H = 480, 800
 FPS_NORMAL = 60
 FPS_IDLE = 5
+GALLERY_RESCAN_S = 1.0  # Render-Pfad: Foto-Ordner höchstens einmal pro Sekunde per stat() prüfen
 
 # Farben
 COLOR_ACCENT = (255, 204, 0)
@@ -63,12 +65,24 @@ COLOR_ERROR = (255, 59, 48)
 
 PAD = 20
 PILL_RADIUS = 18
+TEXT_CACHE_MAX = 256  # gecachte Text-Surfaces pro Renderer
+HAS_FBLITS = hasattr(pygame.Surface, "fblits")  # pygame-ce; sonst blits(doreturn=False)
+
+# Mini-Histogram: Bins -> 1 px breite Balken; Spalte pro Bin ist fix, nur die Höhen ändern sich
+HIST_W, HIST_H, HIST_BINS = 60, 30, 32
+HIST_BAR_X = (np.arange(HIST_BINS) * (HIST_W / HIST_BINS)).astype(np.intp)
+HIST_ROWS = np.arange(HIST_H)
 
 # Kamera-Parameter
-SHUTTER_SPEEDS = ["AUTO", "1/30", "1/60", "1/125", "1/250", "1/500", "1/1000", "1/2000", "1/4000"]
-ISO_VALUES = [100, 200, 400, 800, 1600, 3200, 6400]
-APERTURES = ["f/2.8", "f/4", "f/5.6", "f/8", "f/11", "f/16"]
-FILTER_PRESETS = ["none", "vintage", "bw", "vivid", "portrait"]
+SHUTTER_SPEEDS = ("AUTO", "1/30", "1/60", "1/125", "1/250", "1/500", "1/1000", "1/2000", "1/4000")
+ISO_VALUES = (100, 200, 400, 800, 1600, 3200, 6400)
+APERTURES = ("f/2.8", "f/4", "f/5.6", "f/8", "f/11", "f/16")
+FILTER_PRESETS = ("none", "vintage", "bw", "vivid", "portrait")
+
+# Feste Tupel → Längen einmal beim Import statt len() pro Tastendruck
+N_SHUTTER = len(SHUTTER_SPEEDS)
+ISO_MAX_IDX = len(ISO_VALUES) - 1
+N_FILTERS = len(FILTER_PRESETS)
 
 # Battery Saver
 IDLE_FPS_DROP = 30.0  # Nach 30s → 5 FPS
@@ -164,6 +178,7 @@ class AppState:
         
         # Settings
         self.language = 'en'
+        self._strings = TRANSLATIONS[self.language]  # nur bei Sprachwechsel neu auflösen
         self.haptic_level = HapticLevel.HIGH
         
         # Power
@@ -179,21 +194,25 @@ class AppState:
         # Gallery
         self.photo_dir = Path("./photos")
         self.photo_dir.mkdir(exist_ok=True)
-        self.gallery_photos = sorted(self.photo_dir.glob("IMG_*.jpg"))
+        self.gallery_photos = []
+        self._gallery_mtime = None  # Ordner-mtime beim letzten Einlesen
+        self._gallery_checked = float("-inf")  # letzte gedrosselte Prüfung (perf_counter)
+        self.refresh_gallery()
         
         # Settings Menu
         self.settings_selected = 0
         self.build_settings_menu()
         
-        # Filter Manager
+        # Filter Manager (prewarmed: erster Live-Filter ohne Init-Ruckler)
         self.filter_manager = FilterManager()
+        self.filter_manager.prewarm()
         
         # Gyro (Mock)
         self.gyro_angle = 0.0  # -90 bis +90 Grad
     
     def build_settings_menu(self):
         """Erstellt Settings Menu mit Übersetzungen"""
-        t = TRANSLATIONS[self.language]
+        t = self._strings
         self.settings_items = [
             {"key": "format_card", "label": t['format_card'], "value": ""},
             {"key": "filter", "label": t['filter'], "value": self.get_current_filter().upper()},
@@ -211,11 +230,33 @@ class AppState:
     
     def t(self, key: str) -> str:
         """Übersetzung abrufen"""
-        return TRANSLATIONS[self.language].get(key, key)
+        return self._strings.get(key, key)
+    
+    def refresh_gallery(self, now: Optional[float] = None) -> list:
+        """
+        Galerie-Index; glob + sort nur, wenn sich der Ordner geändert hat (ein stat() statt N)
+        
+        Mit `now` (Render-Pfad) wird höchstens alle GALLERY_RESCAN_S Sekunden geprüft.
+        """
+        if now is not None:
+            if now - self._gallery_checked < GALLERY_RESCAN_S:
+                return self.gallery_photos
+            self._gallery_checked = now
+        try:
+            mtime = self.photo_dir.stat().st_mtime_ns
+            if mtime != self._gallery_mtime:
+                self.gallery_photos = sorted(self.photo_dir.glob("IMG_*.jpg"))
+                self._gallery_mtime = mtime
+        except OSError:
+            # Ordner gelöscht / SD-Karte ausgehängt: leere Galerie statt Absturz im Render-Loop
+            self.gallery_photos = []
+            self._gallery_mtime = None
+        return self.gallery_photos
     
     def toggle_language(self):
         """Sprache wechseln"""
         self.language = 'de' if self.language == 'en' else 'en'
+        self._strings = TRANSLATIONS[self.language]
         self.build_settings_menu()
 
 
@@ -227,7 +268,8 @@ class DateStamper:
     """Brennt Datumsstempel in Bilder (Retro Pixel Font)"""
     
     def __init__(self):
-        # Pixel Font (klein, monospace)
+        # Pixel Font (klein, monospace). Bewusst eigenes Font-Objekt statt fonts['s'] zu teilen:
+        # stamp_image() läuft im Saver-Thread, SDL_ttf-Fonts sind nicht thread-safe.
         try:
             self.font = pygame.font.Font("static/inter_regular.ttf", 14)
         except:
@@ -283,6 +325,19 @@ class ProxyFilterRenderer:
         # Proxy-Größe (1/4 der Display-Auflösung)
         self.proxy_w = RES_W // 2
         self.proxy_h = RES_H // 2
+        
+        # Letztes Ergebnis für (Quelle, Filter). Der Simulator zeigt ein statisches Bild,
+        # also muss nur bei Filterwechsel neu gerechnet werden. Die Referenz auf die Quelle
+        # verhindert, dass eine neue Surface dieselbe Identität bekommt.
+        self._last_src = None
+        self._last_filter = None
+        self._last_result = None
+        
+        # Feste Zielpuffer für Skalierung/Rückkonvertierung: keine Allokation pro Aufruf,
+        # und das Ergebnis liegt direkt im Display-Format
+        self._proxy_buf = pygame.Surface((self.proxy_w, self.proxy_h))
+        self._filtered_buf = pygame.Surface((self.proxy_w, self.proxy_h))
+        self._result_buf = pygame.Surface((RES_W, RES_H))
     
     def apply_filter_live(self, surface: pygame.Surface, filter_name: str) -> pygame.Surface:
         """
@@ -293,8 +348,15 @@ class ProxyFilterRenderer:
         if filter_name == "none":
             return surface
         
-        # 1. Downscale (Performance-Boost!)
-        proxy = pygame.transform.smoothscale(surface, (self.proxy_w, self.proxy_h))
+        # Gleiche Quelle + gleicher Filter -> Ergebnis wiederverwenden (Quelle wird nie in-place geändert)
+        if surface is self._last_src and filter_name == self._last_filter:
+            return self._last_result
+        
+        # 1. Downscale (Performance-Boost!) - entfällt, wenn die Quelle schon Proxy-Größe hat
+        if surface.get_size() == (self.proxy_w, self.proxy_h):
+            proxy = surface
+        else:
+            proxy = pygame.transform.smoothscale(surface, (self.proxy_w, self.proxy_h), self._proxy_buf)
         
         # 2. Surface → NumPy
         arr = pygame.surfarray.array3d(proxy)
@@ -305,11 +367,15 @@ class ProxyFilterRenderer:
         
         # 4. NumPy → Surface
         filtered = np.transpose(filtered, (1, 0, 2))
-        filtered_surf = pygame.surfarray.make_surface(filtered)
+        filtered_surf = self._filtered_buf
+        pygame.surfarray.blit_array(filtered_surf, filtered)
         
         # 5. Upscale zurück (bilinear interpolation, sieht gut aus)
-        result = pygame.transform.smoothscale(filtered_surf, (RES_W, RES_H))
+        result = pygame.transform.smoothscale(filtered_surf, (RES_W, RES_H), self._result_buf)
         
+        self._last_src = surface
+        self._last_filter = filter_name
+        self._last_result = result
         return result
 
 
@@ -426,36 +492,80 @@ class Renderer:
         # Proxy Filter
         self.proxy_filter = ProxyFilterRenderer(state.filter_manager)
         
+        # Text-Cache: (font, text, color) -> Surface; Labels wiederholen sich jeden Frame
+        self._text_cache = {}
+        
+        # Statische Settings-Chrome: Abdunkelung + Pillen einmal rendern statt pro Frame
+        self._pill_cache = {}
+        self._settings_dim = pygame.Surface((RES_W, RES_H), pygame.SRCALPHA)
+        self._settings_dim.fill((0, 0, 0, 230))
+        # Flash-Overlay: eine Surface für Haptic- und Shutter-Flash, pro Frame nur neu gefüllt
+        self._flash_overlay = pygame.Surface((RES_W, RES_H), pygame.SRCALPHA)
+        # Grid-Linien: beim ersten Einschalten einmal gezeichnet, danach ein Blit pro Frame
+        self._grid_overlay = None
+        
         # Histogram Cache (für PRO Mode)
         self.histogram_cache = None
         self.histogram_cache_time = 0.0
     
     def draw_pill(self, rect, color, radius=PILL_RADIUS):
-        """Zeichnet Pille"""
-        surf = pygame.Surface((rect[2], rect[3]), pygame.SRCALPHA)
-        pygame.draw.rect(surf, color, surf.get_rect(), border_radius=radius)
+        """Zeichnet Pille (Surface pro Größe/Farbe/Radius gecacht)"""
+        key = (rect[2], rect[3], color, radius)
+        surf = self._pill_cache.get(key)
+        if surf is None:
+            surf = pygame.Surface((rect[2], rect[3]), pygame.SRCALPHA)
+            pygame.draw.rect(surf, color, surf.get_rect(), border_radius=radius)
+            self._pill_cache[key] = surf = surf.convert_alpha()
         self.screen.blit(surf, (rect[0], rect[1]))
     
+    def _render_text(self, font, text, color):
+        """font.render() mit LRU-Cache (am längsten unbenutzte Einträge fliegen ab TEXT_CACHE_MAX raus)"""
+        key = (font, text, color)
+        surf = self._text_cache.pop(key, None)
+        if surf is None:
+            if len(self._text_cache) >= TEXT_CACHE_MAX:
+                del self._text_cache[next(iter(self._text_cache))]
+            # convert_alpha(): Display-Pixelformat, Blit ohne Formatkonvertierung
+            surf = font.render(text, True, color).convert_alpha()
+        # Wieder hinten einfügen: Reihenfolge = letzte Nutzung
+        self._text_cache[key] = surf
+        return surf
+    
+    def placed_text(self, font, text, color, **anchor):
+        """(Surface, Rect)-Paar für blit_batch(), z.B. placed_text(f, "94%", c, topright=(x, y))"""
+        surf = self._render_text(font, text, color)
+        return surf, surf.get_rect(**anchor)
+    
+    def blit_batch(self, seq):
+        """Mehrere (Surface, Pos)-Paare mit einem Aufruf statt einem blit() pro Element"""
+        if HAS_FBLITS:
+            self.screen.fblits(seq)
+        else:
+            self.screen.blits(seq, doreturn=False)
+    
     def draw_text_center(self, font, text, color, center_xy):
-        surf = font.render(text, True, color)
-        rect = surf.get_rect(center=center_xy)
-        self.screen.blit(surf, rect)
+        self.screen.blit(*self.placed_text(font, text, color, center=center_xy))
     
     def draw_text_left(self, font, text, color, left_xy):
-        surf = font.render(text, True, color)
-        rect = surf.get_rect(topleft=left_xy)
-        self.screen.blit(surf, rect)
+        self.screen.blit(*self.placed_text(font, text, color, topleft=left_xy))
     
     def draw_text_right(self, font, text, color, right_xy):
-        surf = font.render(text, True, color)
-        rect = surf.get_rect(topright=right_xy)
-        self.screen.blit(surf, rect)
+        self.screen.blit(*self.placed_text(font, text, color, topright=right_xy))
     
     def draw_grid_overlay(self):
         """Grid Overlay (Drittel-Regel)"""
         if not self.state.grid_enabled:
             return
         
+        if self._grid_overlay is None:
+            self._grid_overlay = self._build_grid_overlay()
+        self.screen.blit(self._grid_overlay, (0, 0))
+    
+    def _build_grid_overlay(self) -> pygame.Surface:
+        """Grid-Linien auf Colorkey-Surface (RLE: transparente Strecken werden übersprungen)"""
+        surf = pygame.Surface((RES_W, RES_H), 0, self.screen)
+        surf.fill((0, 0, 0))
+        
         # Vertikale Linien
         x1 = RES_W // 3
         x2 = 2 * RES_W // 3
@@ -464,16 +574,19 @@ class Renderer:
         y1 = RES_H // 3
         y2 = 2 * RES_H // 3
         
-        # Weiß mit 30% Opacity
+        # Weiß mit 30% Opacity (Alpha wirkt auf dem Display ohne Alphakanal nicht, wie bisher)
         color = (255, 255, 255, 76)
         
         # Vertikale
-        pygame.draw.line(self.screen, color, (x1, 0), (x1, RES_H), 1)
-        pygame.draw.line(self.screen, color, (x2, 0), (x2, RES_H), 1)
+        pygame.draw.line(surf, color, (x1, 0), (x1, RES_H), 1)
+        pygame.draw.line(surf, color, (x2, 0), (x2, RES_H), 1)
         
         # Horizontale
-        pygame.draw.line(self.screen, color, (0, y1), (RES_W, y1), 1)
-        pygame.draw.line(self.screen, color, (0, y2), (RES_W, y2), 1)
+        pygame.draw.line(surf, color, (0, y1), (RES_W, y1), 1)
+        pygame.draw.line(surf, color, (0, y2), (RES_W, y2), 1)
+        
+        surf.set_colorkey((0, 0, 0), pygame.RLEACCEL)
+        return surf
     
     def draw_level_overlay(self):
         """Level/Wasserwaage (Rechter Rand)"""
@@ -502,13 +615,14 @@ class Renderer:
         pygame.draw.circle(self.screen, color, (x, center_y + offset), 5)
         pygame.draw.circle(self.screen, color, (x, center_y + offset), 5, 1)
     
-    def compute_mini_histogram(self, surface: pygame.Surface) -> pygame.Surface:
+    def compute_mini_histogram(self, surface: pygame.Surface, now: Optional[float] = None) -> pygame.Surface:
         """
         Berechnet Mini-Histogram (optimiert!)
         
         Performance: Nur alle 500ms neu berechnen (gecacht)
         """
-        now = time.perf_counter()
+        if now is None:
+            now = time.perf_counter()
         
         # Cache gültig?
         if self.histogram_cache and (now - self.histogram_cache_time) < 0.5:
@@ -522,21 +636,19 @@ class Renderer:
         gray = np.mean(arr, axis=2).astype(np.uint8)
         
         # Histogram
-        hist, _ = np.histogram(gray, bins=32, range=(0, 256))
-        hist = hist / hist.max()  # Normalisieren
+        hist, _ = np.histogram(gray, bins=HIST_BINS, range=(0, 256))
         
         # Render Histogram (Mini!)
-        hist_w, hist_h = 60, 30
-        hist_surf = pygame.Surface((hist_w, hist_h), pygame.SRCALPHA)
+        hist_surf = pygame.Surface((HIST_W, HIST_H), pygame.SRCALPHA)
         hist_surf.fill((0, 0, 0, 180))
         
-        bar_w = hist_w / 32
-        for i, val in enumerate(hist):
-            bar_h = int(val * hist_h)
-            if bar_h > 0:
-                x = int(i * bar_w)
-                pygame.draw.rect(hist_surf, (255, 255, 255, 200), 
-                               (x, hist_h - bar_h, int(bar_w), bar_h))
+        # Balkenhöhen (normalisiert, abgeschnitten wie int()) auf die festen Spalten verteilen,
+        # dann alle Balken als eine Maske schreiben statt ein draw.rect pro Bin
+        col_h = np.zeros(HIST_W, dtype=np.int32)
+        col_h[HIST_BAR_X] = (hist / hist.max() * HIST_H).astype(np.int32)
+        bars = HIST_ROWS[None, :] >= HIST_H - col_h[:, None]  # (x, y) wie surfarray
+        pygame.surfarray.pixels3d(hist_surf)[bars] = 255
+        pygame.surfarray.pixels_alpha(hist_surf)[bars] = 200
         
         # Cache
         self.histogram_cache = hist_surf
@@ -550,6 +662,9 @@ class Renderer:
         
         Zeigt je nach Display Mode unterschiedlich viel UI
         """
+        # Eine Uhr-Abfrage pro Frame für Histogram-Cache und Flash-Checks
+        now = time.perf_counter()
+        
         # 1. Hintergrund (Viewfinder mit Filter)
         filtered_bg = self.proxy_filter.apply_filter_live(bg_surface, self.state.get_current_filter())
         self.screen.blit(filtered_bg, (0, 0))
@@ -564,59 +679,52 @@ class Renderer:
             # 100% BILD, NICHTS SONST!
             pass
         
-        elif self.state.display_mode == DisplayMode.ESSENTIAL:
-            # Batterie (oben rechts)
-            self.draw_text_right(self.fonts['xs'], "94%", COLOR_WHITE, (RES_W - 10, 10))
-            
-            # Fotos übrig (oben links)
-            photos_left = 999 - len(self.state.gallery_photos)
-            self.draw_text_left(self.fonts['xs'], f"{photos_left} {self.state.t('photos_left')}", 
-                              COLOR_TEXT_GRAY, (10, 10))
-        
-        elif self.state.display_mode == DisplayMode.PRO:
-            # ESSENTIAL + Extra Infos
-            
-            # Batterie
-            self.draw_text_right(self.fonts['xs'], "94%", COLOR_WHITE, (RES_W - 10, 10))
-            
-            # Fotos übrig
-            photos_left = 999 - len(self.state.gallery_photos)
-            self.draw_text_left(self.fonts['xs'], f"{photos_left} {self.state.t('photos_left')}", 
-                              COLOR_TEXT_GRAY, (10, 10))
+        else:
+            # ESSENTIAL (PRO = ESSENTIAL + Extra Infos); alles sammeln, dann ein Batch-Blit
+            font = self.fonts['xs']
             
-            # ISO (oben links, zweite Zeile)
-            iso_val = ISO_VALUES[self.state.iso_idx]
-            self.draw_text_left(self.fonts['xs'], f"ISO {iso_val}", COLOR_ACCENT, (10, 28))
+            # Batterie (oben rechts), Fotos übrig (oben links)
+            # refresh_gallery(): zählt auch Fotos, die der Save-Worker inzwischen geschrieben hat
+            photos_left = 999 - len(self.state.refresh_gallery(now))
+            seq = [
+                self.placed_text(font, "94%", COLOR_WHITE, topright=(RES_W - 10, 10)),
+                self.placed_text(font, f"{photos_left} {self.state.t('photos_left')}",
+                                 COLOR_TEXT_GRAY, topleft=(10, 10)),
+            ]
             
-            # Filter-Name (oben Mitte)
-            filter_name = self.state.get_current_filter().upper()
-            if filter_name != "NONE":
-                self.draw_text_center(self.fonts['xs'], filter_name, COLOR_ACCENT, (RES_W//2, 10))
+            if self.state.display_mode == DisplayMode.PRO:
+                # ISO (oben links, zweite Zeile)
+                iso_val = ISO_VALUES[self.state.iso_idx]
+                seq.append(self.placed_text(font, f"ISO {iso_val}", COLOR_ACCENT, topleft=(10, 28)))
+                
+                # Filter-Name (oben Mitte)
+                filter_name = self.state.get_current_filter().upper()
+                if filter_name != "NONE":
+                    seq.append(self.placed_text(font, filter_name, COLOR_ACCENT, center=(RES_W//2, 10)))
+                
+                # Mini-Histogram (oben rechts, unter Batterie)
+                seq.append((self.compute_mini_histogram(filtered_bg, now), (RES_W - 70, 30)))
             
-            # Mini-Histogram (oben rechts, unter Batterie)
-            hist_surf = self.compute_mini_histogram(filtered_bg)
-            self.screen.blit(hist_surf, (RES_W - 70, 30))
+            self.blit_batch(seq)
         
         # 4. Haptic Flash (visuell)
-        if time.time() - self.state.haptic_flash_time < 0.1:
-            alpha = int(50 * (1 - (time.time() - self.state.haptic_flash_time) / 0.1))
-            overlay = pygame.Surface((RES_W, RES_H), pygame.SRCALPHA)
-            overlay.fill((255, 255, 255, alpha))
-            self.screen.blit(overlay, (0, 0))
+        dt = now - self.state.haptic_flash_time
+        if dt < 0.1:
+            alpha = int(50 * (1 - dt / 0.1))
+            self._flash_overlay.fill((255, 255, 255, alpha))
+            self.screen.blit(self._flash_overlay, (0, 0))
         
         # 5. Shutter Flash (weiß)
-        if time.time() - self.state.shutter_flash_time < 0.15:
-            alpha = int(255 * (1 - (time.time() - self.state.shutter_flash_time) / 0.15))
-            overlay = pygame.Surface((RES_W, RES_H), pygame.SRCALPHA)
-            overlay.fill((255, 255, 255, alpha))
-            self.screen.blit(overlay, (0, 0))
+        dt = now - self.state.shutter_flash_time
+        if dt < 0.15:
+            alpha = int(255 * (1 - dt / 0.15))
+            self._flash_overlay.fill((255, 255, 255, alpha))
+            self.screen.blit(self._flash_overlay, (0, 0))
     
     def render_settings_overlay(self):
         """Settings Menu"""
-        # Blur Overlay
-        overlay = pygame.Surface((RES_W, RES_H), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 230))
-        self.screen.blit(overlay, (0, 0))
+        # Blur Overlay (vorgerendert)
+        self.screen.blit(self._settings_dim, (0, 0))
         
         # Slide Animation
         offset_y = int(self.state.menu_slide_offset)
@@ -668,12 +776,13 @@ class InputHandler:
         if event.type != pygame.KEYDOWN:
             return
         
-        # Input registriert → Reset Idle Timer
-        self.state.last_input_time = time.perf_counter()
+        # Input registriert → Reset Idle Timer (ein Zeitstempel pro Event, monoton)
+        now = time.perf_counter()
+        self.state.last_input_time = now
         self.state.screen_active = True
         
         # Haptic Flash (visuell)
-        self.state.haptic_flash_time = time.time()
+        self.state.haptic_flash_time = now
         
         # Global Controls
         if event.key == pygame.K_d:
@@ -713,11 +822,11 @@ class InputHandler:
         elif self.state.scene == Scene.CAMERA:
             if event.key == pygame.K_UP:
                 # Shutter Speed (BLIND - kein UI!)
-                self.state.shutter_idx = (self.state.shutter_idx + 1) % len(SHUTTER_SPEEDS)
+                self.state.shutter_idx = (self.state.shutter_idx + 1) % N_SHUTTER
                 print(f"📷 Shutter: {SHUTTER_SPEEDS[self.state.shutter_idx]}")
             
             elif event.key == pygame.K_DOWN:
-                self.state.shutter_idx = (self.state.shutter_idx - 1) % len(SHUTTER_SPEEDS)
+                self.state.shutter_idx = (self.state.shutter_idx - 1) % N_SHUTTER
                 print(f"📷 Shutter: {SHUTTER_SPEEDS[self.state.shutter_idx]}")
             
             elif event.key == pygame.K_LEFT:
@@ -725,17 +834,17 @@ class InputHandler:
                 self.state.build_settings_menu()
             
             elif event.key == pygame.K_RIGHT:
-                self.state.iso_idx = min(len(ISO_VALUES) - 1, self.state.iso_idx + 1)
+                self.state.iso_idx = min(ISO_MAX_IDX, self.state.iso_idx + 1)
                 self.state.build_settings_menu()
             
             elif event.key == pygame.K_f:
                 # Filter wechseln
-                self.state.filter_idx = (self.state.filter_idx + 1) % len(FILTER_PRESETS)
+                self.state.filter_idx = (self.state.filter_idx + 1) % N_FILTERS
                 self.state.build_settings_menu()
             
             elif event.key == pygame.K_SPACE:
                 # SHUTTER RELEASE
-                self.capture_photo(current_bg)
+                self.capture_photo(current_bg, now)
         
         # Settings Controls
         elif self.state.scene == Scene.SETTINGS:
@@ -772,10 +881,10 @@ class InputHandler:
         
         self.state.build_settings_menu()
     
-    def capture_photo(self, bg_surface: pygame.Surface):
+    def capture_photo(self, bg_surface: pygame.Surface, now: Optional[float] = None):
         """Nimmt Foto auf (async!)"""
         # Shutter Flash
-        self.state.shutter_flash_time = time.time()
+        self.state.shutter_flash_time = time.perf_counter() if now is None else now
         
         # Async Speichern (blockiert UI nicht!)
         self.photo_saver.save_photo_async(
@@ -786,7 +895,7 @@ class InputHandler:
         )
         
         # Galerie aktualisieren
-        self.state.gallery_photos = sorted(self.state.photo_dir.glob("IMG_*.jpg"))
+        self.state.refresh_gallery()
         
         print(f"📸 Foto aufgenommen ({len(self.state.gallery_photos)} total)")
 
@@ -860,14 +969,16 @@ def main():
     # Test Bild laden
     try:
         bg_img = pygame.image.load("test.jpg")
-        bg_img = pygame.transform.smoothscale(bg_img, (RES_W, RES_H))
+        # convert(): 24-bit JPEG -> Display-Format, sonst Konvertierung bei jedem Blit
+        if bg_img.get_size() != (RES_W, RES_H):
+            bg_img = pygame.transform.smoothscale(bg_img, (RES_W, RES_H))
+        bg_img = bg_img.convert()
         print("✅ test.jpg geladen")
     except:
-        # Gradient Fallback
+        # Gradient Fallback (eine Spalte berechnen, per Broadcasting auf alle Zeilen, ein Kopiervorgang)
         bg_img = pygame.Surface((RES_W, RES_H))
-        for y in range(RES_H):
-            c = int(40 + (y / RES_H) * 60)
-            pygame.draw.line(bg_img, (c, c, c), (0, y), (RES_W, y))
+        c = (40 + (np.arange(RES_H) / RES_H) * 60).astype(np.int32)
+        pygame.surfarray.blit_array(bg_img, np.broadcast_to(c[None, :, None], (RES_W, RES_H, 3)))
         print("⚠️  test.jpg fehlt, nutze Gradient")
     
     # Gyro Mock (oszilliert)
@@ -908,7 +1019,7 @@ def main():
             
             # Haptic Flash simulieren
             if event.type == pygame.KEYDOWN and event.key == pygame.K_h:
-                state.haptic_flash_time = time.time()
+                state.haptic_flash_time = time.perf_counter()
             
             input_handler.handle_event(event, bg_img)
         
@@ -917,7 +1028,8 @@ def main():
         
         # Gyro Mock (oszilliert)
         gyro_time += 0.02
-        state.gyro_angle = np.sin(gyro_time) * 8  # ±8 Grad
+        # math.sin: Python-Float rein/raus, kein NumPy-Skalar-Overhead pro Frame
+        state.gyro_angle = math.sin(gyro_time) * 8  # ±8 Grad
         
         # Render
         if state.screen_active:
@@ -5,11 +5,18 @@ from __future__ import annotations
 
 import json
 import time
+from functools import lru_cache
 from pathlib import Path
 
 import pygame
 
+try:
+    import numpy as np
+except Exception:  # pragma: no cover
+    np = None
+
 from core.app_controller import AppController
+from core.input_events import EventType
 from core.ui_renderer import UIRenderer
 from adapters.pi_io import PIIOAdapter
 
@@ -24,16 +31,35 @@ def _load_config() -> dict:
     return {}
 
 
-def camera_or_fallback_frame(width: int, height: int, tick: float) -> pygame.Surface:
-    # placeholder for real camera surface injection; keeps zero-copy-ready surface handoff contract.
+@lru_cache(maxsize=2)
+def _background(width: int, height: int) -> pygame.Surface:
+    """Static vertical gradient under the placeholder frame; built once per size."""
     surf = pygame.Surface((width, height))
+    if np is not None:
+        # one bulk copy instead of a draw.line per scanline
+        c = (16 + 36 * (np.arange(height) / max(1, height))).astype(np.int32)
+        col = np.stack([c, c, c + 6], axis=-1)
+        pygame.surfarray.blit_array(surf, np.broadcast_to(col[None, :, :], (width, height, 3)))
+        return surf
     for y in range(height):
         c = int(16 + 36 * (y / max(1, height)))
         pygame.draw.line(surf, (c, c, c + 6), (0, y), (width, y))
+    return surf
+
+
+@lru_cache(maxsize=2)
+def _fallback_frame(width: int, height: int) -> pygame.Surface:
+    surf = _background(width, height).copy()
     pygame.draw.rect(surf, (96, 96, 128), (width // 2 - 40, height // 2 - 22, 80, 44), 2)
     return surf
 
 
+def camera_or_fallback_frame(width: int, height: int, tick: float) -> pygame.Surface:
+    # placeholder for real camera surface injection; keeps zero-copy-ready surface handoff contract.
+    # the fallback never changes, so it is composed once and handed out as is
+    return _fallback_frame(width, height)
+
+
 def main():
     cfg = _load_config()
     width = 800
@@ -50,19 +76,27 @@ def main():
     io = PIIOAdapter()
     debug_overlay = False
 
+    frame_ms = max(1, 1000 // fps)
+
     running = True
     while running:
-        for ev in io.poll():
-            if ev.type.name == "SHUTDOWN":
-                running = False
-            controller.handle(ev)
-            if ev.type.name == "ENCODER_PRESS":
+        # nothing animating: let the process sleep in SDL until input or the next frame slot
+        idle = controller.idle and not debug_overlay
+        events = io.poll_blocking(frame_ms) if idle else io.poll()
+        for ev in controller.drain(events):
+            if ev.type == EventType.ENCODER_PRESS:
                 debug_overlay = not debug_overlay
-
-        frame = camera_or_fallback_frame(width, height, time.perf_counter())
-        _stats = renderer.render(controller.state, frame, show_debug=debug_overlay)
+                controller.measure_latency = debug_overlay
+        running = not controller.state.shutdown_requested
+        controller.tick()
+
+        now = time.perf_counter()  # one clock read drives the frame and its animations
+        frame = camera_or_fallback_frame(width, height, now)
+        # the placeholder frame is static; a live camera feed must pass frame_changed=True
+        stats = renderer.render(controller.state, frame, show_debug=debug_overlay, now=now, frame_changed=False)
         rects = controller.pop_dirty()
-        renderer.dirty_or_full(rects)
+        if not stats.skipped:
+            renderer.dirty_or_full(rects)
         clock.tick(fps)
 
     pygame.quit()
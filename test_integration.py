@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 import time
 
 import pytest
@@ -11,10 +12,16 @@ try:
 except Exception:  # pragma: no cover
     np = None
 
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from adapters.pc_io import PCIOAdapter
 from benchmark import run_benchmark
-from camera_service import CameraConfig, CameraService
-from core.app_controller import AppController
+from camera_service import CameraConfig, CameraProcess, CameraService
+from core.app_controller import AppController, AppState
 from core.input_events import EventType, InputEvent
+from core.ui_renderer import UIRenderer
 
 
 def test_smoke_core_controller_and_camera_service():
@@ -31,6 +38,133 @@ def test_smoke_core_controller_and_camera_service():
     svc.stop()
 
 
+def test_async_save_writes_preview_frame(tmp_path):
+    svc = CameraService(CameraConfig())
+    svc.start()
+    svc.pump_preview()
+    done = []
+    svc.capture_photo(tmp_path / "IMG_0001.jpg", lambda ok, path: done.append((ok, path)))
+    deadline = time.perf_counter() + 5.0
+    while not done and time.perf_counter() < deadline:
+        time.sleep(0.01)
+    svc.stop()
+    assert done and done[0][0] is True
+    assert done[0][1].exists() and done[0][1].stat().st_size > 0
+    assert svc.get_stats().capture_count == 1
+
+
+@pytest.mark.skipif(np is None, reason="numpy unavailable for ndarray-specific checks")
+def test_queued_photo_frame_survives_later_captures(tmp_path):
+    svc = CameraService(CameraConfig())  # not started: the save stays queued
+    svc.pump_preview()
+    expected = svc.get_preview_frame().copy()
+    svc.capture_photo(tmp_path / "IMG_0001.jpg")
+    for fill in (1, 2):  # later captures overwrite the recycled preview buffer in place
+        svc._proc.capture_preview_frame()[:] = fill
+        svc.pump_preview()
+    _, frame_ref, _, _ = svc._save_queue.get_nowait()
+    assert np.array_equal(frame_ref, expected)
+
+
+@pytest.mark.skipif(np is None, reason="numpy unavailable for ndarray-specific checks")
+def test_jpeg_encode_keeps_full_range():
+    import io
+
+    from camera_service import _encode_jpeg
+
+    Image = pytest.importorskip("PIL.Image")
+    frame = np.zeros((48, 64, 3), dtype=np.uint8)
+    frame[:, 32:] = 255
+    jpeg = _encode_jpeg(frame, 85)
+    if jpeg is None:
+        pytest.skip("no cv2/turbojpeg encoder")
+    decoded = np.asarray(Image.open(io.BytesIO(bytes(jpeg))).convert("RGB"))
+    # JFIF is full range: limited-range YUV would decode black as ~16 and white as ~235
+    assert int(decoded[:, :24].max()) <= 4
+    assert int(decoded[:, 40:].min()) >= 251
+
+
+@pytest.mark.skipif(np is None, reason="numpy unavailable for ndarray-specific checks")
+def test_shared_frame_buffer_handoff():
+    from types import SimpleNamespace
+
+    from ipc import SharedFrameBuffer
+
+    cfg = CameraConfig()
+    name = f"selimcam_test_{os.getpid()}"
+    producer = SharedFrameBuffer(cfg.preview_width, cfg.preview_height, name=name)
+    consumer = SharedFrameBuffer(cfg.preview_width, cfg.preview_height, name=name)
+    try:
+        svc = CameraService(cfg, ipc_manager=SimpleNamespace(frame_buffer=producer))
+        svc.start()
+        svc.pump_preview()
+        frame = consumer.read_frame()
+        assert not frame.flags.writeable
+        assert np.array_equal(frame, svc.get_preview_frame())
+        assert consumer.sequence == 1
+        padded = np.zeros((cfg.preview_height, cfg.preview_width + 16, 3), dtype=np.uint8)
+        padded[:, : cfg.preview_width] = 7
+        assert producer.commit_frame(padded) == 2
+        assert (consumer.read_frame() == 7).all()
+        svc.stop()
+    finally:
+        consumer.cleanup()
+        producer.cleanup()
+
+
+def test_camera_process_run_loop_stops_on_shutdown():
+    import threading
+    from types import SimpleNamespace
+
+    notified = []
+    fb = SimpleNamespace(write_frame=lambda frame: True)
+    proc = CameraProcess(CameraConfig(preview_fps=100), SimpleNamespace(frame_buffer=fb, send_frame_ready=notified.append))
+    worker = threading.Thread(target=proc.run)
+    worker.start()
+    time.sleep(0.1)
+    proc.shutdown()
+    worker.join(timeout=1.0)
+    assert not worker.is_alive()
+    assert notified and not proc.preview_active
+    assert all(1 <= n <= 4 for n in notified)
+
+
+def test_thread_scheduling_is_opt_in(monkeypatch):
+    import camera_service
+
+    off = {"capture_cpu": None, "save_cpu": None, "capture_rt_priority": 0}
+    monkeypatch.setattr(camera_service, "HAS_CAMERA", False)  # desktop: the Pi "scheduling" section is ignored
+    assert camera_service._scheduling(CameraConfig()) == off
+    monkeypatch.setattr(camera_service, "HAS_CAMERA", True)
+    assert camera_service._scheduling(CameraConfig()) == off  # shipped defaults leave the scheduler alone
+    assert camera_service._scheduling(CameraConfig(save_cpu=0))["save_cpu"] == 0
+    assert camera_service._scheduling(CameraConfig(capture_rt_priority=50))["capture_rt_priority"] == 50
+
+
+def test_camera_process_sheds_preview_frames_under_memory_pressure():
+    proc = CameraProcess(CameraConfig(), None)
+    proc._rss_limit = 100
+    masks = []
+    for rss in (200, 200, 200, 200, 50, 50):
+        proc._adapt_skip(rss)
+        masks.append(proc._skip_mask)
+    assert masks == [1, 3, 7, 7, 3, 1]
+
+
+@pytest.mark.skipif(np is None, reason="numpy not installed")
+def test_yuv420_preview_frame_converts_lazily():
+    from camera_service import SceneAnalyzer, preview_to_rgb
+
+    i420 = np.full((240 * 3 // 2, 320), 20, dtype=np.uint8)
+    i420[240:] = 128  # neutral chroma
+    rgb = preview_to_rgb(i420)
+    assert rgb.shape == (240, 320, 3)
+    assert preview_to_rgb(rgb) is rgb
+    analyzer = SceneAnalyzer()
+    analyzer.last_analysis_time = float("-inf")
+    assert analyzer.analyze(i420, lux=500) == "low_light"
+
+
 def test_keyboard_event_semantics():
     controller = AppController(800, 480)
     controller.handle(InputEvent(EventType.ENCODER_DETENT, delta=1))
@@ -39,12 +173,142 @@ def test_keyboard_event_semantics():
     assert controller.state.filter_idx != first
 
 
+def test_dirty_rects_collapse_to_one_full_update():
+    controller = AppController(800, 480)
+    controller.handle(InputEvent(EventType.FLASH_TOGGLE))
+    assert controller.pop_dirty() == [(620, 0, 180, 90)]
+    controller.handle(InputEvent(EventType.FLASH_TOGGLE))
+    controller.handle(InputEvent(EventType.TOGGLE_GRID))
+    controller.handle(InputEvent(EventType.TOGGLE_LANG))
+    assert controller.pop_dirty() == [(0, 0, 800, 480)]
+    for _ in range(6):  # 6 x 800x90 exceeds the screen area
+        controller.mark_dirty((0, 0, 800, 90))
+    assert controller.pop_dirty() == [(0, 0, 800, 480)]
+    for i in range(40):  # many small rects are capped too
+        controller.mark_dirty((i, 0, 1, 1))
+    assert controller.pop_dirty() == [(0, 0, 800, 480)]
+
+
+def test_pop_dirty_merges_overlapping_rects():
+    controller = AppController(800, 480)
+    controller.handle(InputEvent(EventType.TOGGLE_LANG))
+    controller.handle(InputEvent(EventType.TOGGLE_LANG))  # duplicate
+    controller.handle(InputEvent(EventType.FLASH_TOGGLE))  # contained in the top bar
+    controller.handle(InputEvent(EventType.SHUTTER_PRESS))  # disjoint
+    assert sorted(controller.pop_dirty()) == [(0, 0, 800, 90), (0, 410, 800, 70)]
+    for rect in ((0, 0, 10, 10), (20, 0, 10, 10), (5, 5, 20, 2)):  # bridge joins both
+        controller.mark_dirty(rect)
+    assert controller.pop_dirty() == [(0, 0, 30, 10)]
+
+
+def test_language_toggle_switches_translations():
+    controller = AppController(800, 480)
+    assert controller.state.t("grid") == "Grid"
+    controller.handle(InputEvent(EventType.TOGGLE_LANG))
+    assert controller.state.lang == "de" and controller.state.t("grid") == "Raster"
+    assert controller.state.t("missing") == "missing"
+    controller.handle(InputEvent(EventType.SHUTTER_PRESS))
+    assert controller.state.toast == controller.state.t("capture")
+
+
+def test_drain_coalesces_touch_move_runs():
+    controller = AppController(800, 480)
+    moves = [InputEvent(EventType.TOUCH_MOVE, pos=(i, 0), delta=1) for i in range(5)]
+    batch = moves[:3] + [InputEvent(EventType.TOGGLE_GRID)] + moves[3:]
+    handled = controller.drain(batch)
+    assert [e.type for e in handled] == [EventType.TOUCH_MOVE, EventType.TOGGLE_GRID, EventType.TOUCH_MOVE]
+    assert handled[0].pos == (2, 0) and handled[0].delta == 3
+    assert handled[2].pos == (4, 0) and handled[2].delta == 2
+    assert all(m.delta == 1 for m in moves)  # caller's events left untouched
+    assert controller.state.grid_on
+
+
+def test_toast_expires_on_tick():
+    controller = AppController(800, 480)
+    controller.tick()  # nothing scheduled
+    assert controller.idle
+    controller.handle(InputEvent(EventType.SHUTTER_PRESS))
+    assert controller.state.toast and not controller.idle
+    controller.tick()
+    assert controller.state.toast  # still within TOAST_SEC
+    controller.toast_sec = 0.0
+    controller.handle(InputEvent(EventType.SHUTTER_PRESS))
+    controller.pop_dirty()
+    controller.tick()
+    assert controller.state.toast == "" and controller.pop_dirty()
+
+
+def test_renderer_skips_unchanged_static_frames():
+    pygame.display.init()
+    pygame.font.init()
+    screen = pygame.display.set_mode((800, 480))
+    renderer = UIRenderer(screen, 800, 480)
+    state = AppState()
+    frame = pygame.Surface((800, 480))
+    assert not renderer.render(state, frame, frame_changed=False).skipped
+    assert renderer.render(state, frame, frame_changed=False).skipped
+    assert not renderer.render(state, frame).skipped  # live frames always draw
+    state.grid_on = True
+    assert not renderer.render(state, frame, frame_changed=False).skipped
+
+
+def test_renderer_survives_pygame_reinit():
+    for _ in range(2):  # fonts from before pygame.quit() must not be handed out again
+        pygame.init()
+        screen = pygame.display.set_mode((800, 480))
+        UIRenderer(screen, 800, 480).render(AppState(), pygame.Surface((800, 480)))
+        pygame.quit()
+
+
+def test_text_cache_evicts_least_recently_used():
+    pygame.display.init()
+    pygame.font.init()
+    screen = pygame.display.set_mode((800, 480))
+    renderer = UIRenderer(screen, 800, 480)
+    toast = renderer._label("m", "toast", (255, 204, 0))
+    for i in range(600):  # e.g. a debug readout changing every frame
+        renderer._label("s", f"input {i} ms", (235, 235, 235))
+        assert renderer._label("m", "toast", (255, 204, 0)) is toast
+
+
+def test_pc_adapter_translates_only_handled_events():
+    pygame.display.init()
+    pygame.display.set_mode((8, 8))
+    io = PCIOAdapter()
+    pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_g, mod=0, unicode="g", scancode=0))
+    pygame.event.post(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=(10, 20)))
+    pygame.event.post(pygame.event.Event(pygame.USEREVENT))
+    pygame.event.post(pygame.event.Event(pygame.MOUSEMOTION, pos=(11, 20), rel=(1, 0), buttons=(1, 0, 0)))
+    pygame.event.post(pygame.event.Event(pygame.MOUSEMOTION, pos=(12, 20), rel=(1, 0), buttons=(0, 0, 0)))
+    events = io.poll()
+    assert [e.type for e in events] == [EventType.TOGGLE_GRID, EventType.TOUCH_DOWN, EventType.TOUCH_MOVE]
+    assert events[1].pos == (10, 20)
+    assert io.poll() == []
+    pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_RIGHT, mod=0, unicode="", scancode=0))
+    events = io.poll_blocking(50)
+    assert [(e.type, e.delta) for e in events] == [(EventType.ENCODER_DETENT, 1)]
+    assert io.poll_blocking(1) == []
+    pygame.display.quit()
+
+
 def test_benchmark_json_safe_path():
     report = run_benchmark(seconds=0.1, fps=10)
     assert report.avg_frame_ms >= 0.0
     assert report.max_input_latency_ms >= 0.0
 
 
+@pytest.mark.skipif(np is None, reason="numpy unavailable for ndarray-specific checks")
+def test_filter_out_buffer_matches_allocating_path():
+    from filters import FilterManager
+
+    manager = FilterManager()
+    img = np.random.randint(0, 255, (24, 32, 3), dtype=np.uint8)
+    out = np.empty_like(img)
+    for name in ("vintage", "bw", "brightness"):
+        assert manager.apply_filter(img, name, out=out) is out
+        assert np.array_equal(out, manager.apply_filter(img, name))
+
+
 @pytest.mark.skipif(np is None, reason="numpy unavailable for ndarray-specific checks")
 def test_optional_numpy_path():
     arr = np.zeros((4, 4, 3), dtype=np.uint8)